@@ -1,9 +1,35 @@
 """FastAPI application for economic models platform."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from apps.api.src.middleware import StaticOriginCORSMiddleware
+from apps.api.src.responses import ORJSONResponse
 from apps.api.src.routes.solow import router as solow_router
 from apps.api.src.routes.islm import router as islm_router
+from packages.models.src.macroeconomic._islm_kernel import islm_solve
+
+# Each uvicorn worker runs its own simulation process pool, so the cores are
+# split between workers rather than every worker claiming all of them. The
+# default is a single worker that fans CPU-bound work out to the pool.
+API_WORKERS = int(os.environ.get("API_WORKERS", 1))
+POOL_WORKERS = max(1, (os.cpu_count() or 1) // API_WORKERS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up compiled kernels and own the process pool for this run."""
+    # Trigger JIT compilation (or load it from cache) before the first request
+    islm_solve(10.0, 0.5, 20.0, 1.0, 0.0, 0.2, 1.0, 50.0, 40.0, 100.0, 1.0)
+
+    # Process pool for CPU-bound simulations; workers start on first use
+    app.state.pool = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+    yield
+    app.state.pool.shutdown(cancel_futures=True)
+
 
 app = FastAPI(
     title="Economic Models API",
@@ -11,15 +37,17 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Compress large simulation payloads; small bodies are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware for frontend integration
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],  # Next.js dev server
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    StaticOriginCORSMiddleware,
+    allow_origin="http://localhost:3000",  # Next.js dev server
 )
 
 # Include routers
@@ -41,3 +69,16 @@ async def root():
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "apps.api.src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=API_WORKERS,
+    )
@@ -0,0 +1,90 @@
+"""ASGI middleware for the economic models API."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class StaticOriginCORSMiddleware:
+    """CORS for a single, fixed frontend origin.
+
+    Compares the raw Origin header bytes against the allowed origin and
+    attaches precomputed headers, instead of running the general-purpose
+    origin matching of Starlette's CORSMiddleware on every request.
+    Preflights from other origins are rejected with 400, as CORSMiddleware
+    does; other requests from other origins pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origin: str) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            allow_origin: The only origin allowed to make credentialed requests
+        """
+        self.app = app
+        self.allow_origin = allow_origin.encode("latin-1")
+        self.simple_headers = [
+            (b"access-control-allow-origin", self.allow_origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self.preflight_headers = self.simple_headers + [
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-max-age", b"600"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        ]
+        self.rejected_body = b"Disallowed CORS origin"
+        self.rejected_headers = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-max-age", b"600"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(self.rejected_body)).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        is_preflight = False
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = scope["method"] == "OPTIONS"
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin != self.allow_origin:
+            if is_preflight and origin is not None:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 400,
+                        "headers": self.rejected_headers,
+                    }
+                )
+                await send({"type": "http.response.body", "body": self.rejected_body})
+                return
+            await self.app(scope, receive, send)
+            return
+
+        if is_preflight:
+            headers = list(self.preflight_headers)
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + self.simple_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -0,0 +1,80 @@
+"""Response classes for the economic models API."""
+
+from typing import Any, Dict
+
+import msgpack
+import numpy as np
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from packages.simulation.src.serialization import json_default
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    NumPy arrays are serialized directly from their buffers, so simulation
+    results can be returned without converting them to Python lists first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(
+            content,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode NumPy values for msgpack.
+
+    Arrays become a small header plus their raw buffer, so clients can
+    reinterpret the bytes as a typed array without parsing digits.
+    """
+    if isinstance(obj, np.ndarray):
+        return {
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "data": np.ascontiguousarray(obj).tobytes(),
+        }
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    raise TypeError(f"Type is not msgpack serializable: {type(obj).__name__}")
+
+
+class MsgpackResponse(Response):
+    """Binary response for internal clients that accept application/msgpack."""
+
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to msgpack bytes."""
+        return msgpack.packb(content, default=_msgpack_default)
+
+
+def as_float32(array: np.ndarray) -> np.ndarray:
+    """Quantize an array to contiguous float32 for transport.
+
+    Float32 keeps ~7 significant digits, ample for plotting and policy
+    comparisons, and halves the bytes written per sample.
+    """
+    return np.ascontiguousarray(array, dtype=np.float32)
+
+
+def array_response(request: Request, content: Dict[str, Any]) -> Response:
+    """Render array-heavy content in the format the client asked for.
+
+    Args:
+        request: Incoming request, used for Accept header negotiation
+        content: Response body, may contain NumPy arrays
+
+    Returns:
+        MsgpackResponse if the client accepts application/msgpack,
+        otherwise ORJSONResponse
+    """
+    if "application/msgpack" in request.headers.get("accept", ""):
+        return MsgpackResponse(content)
+    return ORJSONResponse(content)
@@ -1,9 +1,20 @@
 """API routes for IS-LM model."""
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import re
+from functools import lru_cache, partial
+
+import msgspec
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from packages.models.src.macroeconomic.islm import ISLMModel, ISLMParameters
 from packages.simulation.src.engine import SimulationEngine
+from apps.api.src.responses import ORJSONResponse, array_response, as_float32
 from apps.api.src.schemas.islm import (
+    ISLM_PARAMETERS_DECODER,
+    ISLMParametersMsg,
     ISLMParametersRequest,
     EquilibriumResponse,
     PolicyEffectRequest,
@@ -13,82 +24,195 @@ from apps.api.src.schemas.islm import (
     ImpulseResponseRequest,
 )
 
-router = APIRouter(prefix="/api/islm", tags=["islm"])
+router = APIRouter(
+    prefix="/api/islm", tags=["islm"], default_response_class=ORJSONResponse
+)
+
+
+@lru_cache(maxsize=512)
+def _build_islm(params: ISLMParametersRequest) -> ISLMModel:
+    """Build an IS-LM model, reusing instances for repeated parameter sets.
+
+    Request parameters are frozen and hashable, so they serve as the cache
+    key directly. Models are read-only after construction, so cached
+    instances can be shared safely between requests.
+
+    Args:
+        params: Validated model parameters
+
+    Returns:
+        Model instance for the given parameters
+    """
+    return ISLMModel(params)
+
+
+@lru_cache(maxsize=256)
+def _islm_engine(params: ISLMParametersRequest) -> SimulationEngine:
+    """Simulation engine for the cached model with these parameters."""
+    return SimulationEngine(_build_islm(params))
+
+
+def _policy_model(request: PolicyEffectRequest) -> ISLMModel:
+    """Dependency resolving the cached model for a policy effect request."""
+    return _build_islm(request.parameters)
+
+
+# msgspec reports where decoding failed as a "- at `$.field`" suffix, and
+# missing fields by name; both map onto FastAPI's ("body", field) locations
+_ERROR_PATH = re.compile(r" - at `\$(?P<path>[^`]*)`$")
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD = re.compile(r"missing required field `(?P<field>[^`]+)`")
+
 
+def _body_validation_error(
+    error: msgspec.MsgspecError, body: bytes
+) -> RequestValidationError:
+    """Translate a msgspec decoding error into FastAPI's 422 error shape.
 
-@router.post("/equilibrium", response_model=EquilibriumResponse)
-async def calculate_equilibrium(params: ISLMParametersRequest):
+    Args:
+        error: Error raised while decoding the request body
+        body: Raw request body
+
+    Returns:
+        Validation error whose loc and input match Pydantic body errors
+    """
+    msg = str(error)
+    loc: list = ["body"]
+    match = _ERROR_PATH.search(msg)
+    if match:
+        msg = msg[: match.start()]
+        for key, index in _PATH_PART.findall(match["path"]):
+            loc.append(key or int(index))
+
+    # Offending value for the error location, as Pydantic reports it
+    try:
+        value = msgspec.json.decode(body)
+    except msgspec.DecodeError:
+        value = None
+    for part in loc[1:]:
+        try:
+            value = value[part]
+        except (KeyError, IndexError, TypeError):
+            value = None
+            break
+
+    # Missing fields point at the field itself; the input is the enclosing object
+    missing = _MISSING_FIELD.search(msg)
+    if missing:
+        loc.append(missing["field"])
+
+    return RequestValidationError(
+        [{"type": "value_error", "loc": tuple(loc), "msg": msg, "input": value}]
+    )
+
+
+@lru_cache(maxsize=1024)
+def _equilibrium_bytes(params: ISLMParametersMsg) -> bytes:
+    """Encoded JSON body of the equilibrium response for these parameters.
+
+    The result is a deterministic function of the parameters, so repeated
+    requests (e.g. from UI sliders) skip model arithmetic, response model
+    construction and serialization entirely.
+
+    Args:
+        params: Validated model parameters
+
+    Returns:
+        Serialized EquilibriumResponse body
+    """
+    # Constraints were already checked by msgspec, skip Pydantic validation
+    model = ISLMModel(ISLMParameters.model_construct(**msgspec.structs.asdict(params)))
+    eq = model.calculate_equilibrium()
+    return orjson.dumps(EquilibriumResponse.model_construct(**eq).model_dump())
+
+
+@router.post(
+    "/equilibrium",
+    responses={200: {"model": EquilibriumResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/ISLMParametersRequest"}
+                }
+            },
+        }
+    },
+)
+async def calculate_equilibrium(request: Request):
     """Calculate IS-LM equilibrium.
 
+    The body is decoded and validated by msgspec in a single pass rather
+    than through FastAPI's Pydantic body parsing.
+
     Args:
-        params: Model parameters
+        request: Request whose JSON body holds the model parameters
 
     Returns:
         Equilibrium income, interest rate, consumption, investment, etc.
     """
+    body = await request.body()
     try:
-        # Convert request schema to model parameters
-        model_params = ISLMParameters(**params.model_dump())
-        model = ISLMModel(model_params)
+        params = ISLM_PARAMETERS_DECODER.decode(body)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise _body_validation_error(e, body)
 
-        # Calculate equilibrium
-        eq = model.calculate_equilibrium()
-
-        return EquilibriumResponse(**eq)
+    try:
+        # Serve cached response bytes for identical parameters
+        return Response(content=_equilibrium_bytes(params), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/fiscal-effect", response_model=PolicyEffectResponse)
-async def calculate_fiscal_effect(request: PolicyEffectRequest):
+@router.post("/fiscal-effect", responses={200: {"model": PolicyEffectResponse}})
+def calculate_fiscal_effect(
+    request: PolicyEffectRequest, model: ISLMModel = Depends(_policy_model)
+):
     """Calculate effect of fiscal policy change.
 
     Args:
         request: Parameters and fiscal policy changes (delta_g, delta_t)
+        model: Cached model for the request parameters
 
     Returns:
         Changes in income, interest rate, consumption, investment
     """
     try:
-        # Create model
-        model_params = ISLMParameters(**request.parameters.model_dump())
-        model = ISLMModel(model_params)
-
         # Calculate fiscal expansion effect
         effect = model.fiscal_expansion_effect(
             delta_g=request.delta_g, delta_t=request.delta_t
         )
 
-        return PolicyEffectResponse(**effect)
+        return PolicyEffectResponse.model_construct(**effect)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/monetary-effect", response_model=PolicyEffectResponse)
-async def calculate_monetary_effect(request: PolicyEffectRequest):
+@router.post("/monetary-effect", responses={200: {"model": PolicyEffectResponse}})
+def calculate_monetary_effect(
+    request: PolicyEffectRequest, model: ISLMModel = Depends(_policy_model)
+):
     """Calculate effect of monetary policy change.
 
     Args:
         request: Parameters and monetary policy change (delta_m)
+        model: Cached model for the request parameters
 
     Returns:
         Changes in income, interest rate, consumption, investment
     """
     try:
-        # Create model
-        model_params = ISLMParameters(**request.parameters.model_dump())
-        model = ISLMModel(model_params)
-
         # Calculate monetary expansion effect
         effect = model.monetary_expansion_effect(delta_m=request.delta_m)
 
-        return PolicyEffectResponse(**effect)
+        return PolicyEffectResponse.model_construct(**effect)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/simulate", response_model=SimulationResponse)
-async def simulate_model(request: SimulationRequest):
+@router.post("/simulate", responses={200: {"model": SimulationResponse}})
+async def simulate_model(request: SimulationRequest, http_request: Request):
     """Run simulation of IS-LM model with policy shocks.
 
     Args:
@@ -98,36 +222,41 @@ async def simulate_model(request: SimulationRequest):
         Time series of income, interest rate, consumption, investment
     """
     try:
-        # Create model
-        model_params = ISLMParameters(**request.parameters.model_dump())
-        model = ISLMModel(model_params)
-
-        # Create simulation engine
-        engine = SimulationEngine(model)
-
-        # Run simulation
-        result = engine.simulate_islm(
-            horizon=request.horizon,
-            shock_times=request.shock_times,
-            shock_types=request.shock_types,
-            shock_sizes=request.shock_sizes,
+        # Reuse cached engine for identical parameters
+        engine = _islm_engine(request.parameters)
+
+        # Run simulation in the process pool to keep the event loop free
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            http_request.app.state.pool,
+            partial(
+                engine.simulate_islm,
+                request.horizon,
+                *request.shock_arrays,
+                dtype=np.float32,
+            ),
         )
 
-        # Convert to response format
-        return SimulationResponse(
-            time=result.time.tolist(),
-            income=result.states["income"].tolist(),
-            interest_rate=result.states["interest_rate"].tolist(),
-            consumption=result.states["consumption"].tolist(),
-            investment=result.states["investment"].tolist(),
-            metadata=result.metadata,
+        # Serialize float32 arrays directly as JSON or msgpack, bypassing jsonable_encoder
+        return array_response(
+            http_request,
+            {
+                "time": as_float32(result.time),
+                "income": as_float32(result.states["income"]),
+                "interest_rate": as_float32(result.states["interest_rate"]),
+                "consumption": as_float32(result.states["consumption"]),
+                "investment": as_float32(result.states["investment"]),
+                "metadata": result.metadata,
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/impulse-response", response_model=SimulationResponse)
-async def calculate_impulse_response(request: ImpulseResponseRequest):
+@router.post("/impulse-response", responses={200: {"model": SimulationResponse}})
+async def calculate_impulse_response(
+    request: ImpulseResponseRequest, http_request: Request
+):
     """Calculate impulse response to policy shock.
 
     Args:
@@ -137,28 +266,33 @@ async def calculate_impulse_response(request: ImpulseResponseRequest):
         Time series showing response to shock
     """
     try:
-        # Create model
-        model_params = ISLMParameters(**request.parameters.model_dump())
-        model = ISLMModel(model_params)
-
-        # Create simulation engine
-        engine = SimulationEngine(model)
-
-        # Calculate impulse response
-        result = engine.islm_impulse_response(
-            shock_type=request.shock_type,
-            shock_size=request.shock_size,
-            horizon=request.horizon,
+        # Reuse cached engine for identical parameters
+        engine = _islm_engine(request.parameters)
+
+        # Calculate impulse response in the process pool to keep the event loop free
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            http_request.app.state.pool,
+            partial(
+                engine.islm_impulse_response,
+                shock_type=request.shock_type,
+                shock_size=request.shock_size,
+                horizon=request.horizon,
+                dtype=np.float32,
+            ),
         )
 
-        # Convert to response format
-        return SimulationResponse(
-            time=result.time.tolist(),
-            income=result.states["income"].tolist(),
-            interest_rate=result.states["interest_rate"].tolist(),
-            consumption=result.states["consumption"].tolist(),
-            investment=result.states["investment"].tolist(),
-            metadata=result.metadata,
+        # Serialize float32 arrays directly as JSON or msgpack, bypassing jsonable_encoder
+        return array_response(
+            http_request,
+            {
+                "time": as_float32(result.time),
+                "income": as_float32(result.states["income"]),
+                "interest_rate": as_float32(result.states["interest_rate"]),
+                "consumption": as_float32(result.states["consumption"]),
+                "investment": as_float32(result.states["investment"]),
+                "metadata": result.metadata,
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,8 +1,14 @@
 """API routes for Solow growth model."""
 
-from fastapi import APIRouter, HTTPException
-from packages.models.src.macroeconomic.solow import SolowGrowthModel, SolowParameters
+import asyncio
+from functools import lru_cache, partial
+
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from packages.models.src.macroeconomic.solow import SolowGrowthModel
 from packages.simulation.src.engine import SimulationEngine
+from apps.api.src.responses import ORJSONResponse, array_response, as_float32
 from apps.api.src.schemas.solow import (
     SolowParametersRequest,
     SteadyStateResponse,
@@ -11,11 +17,54 @@ from apps.api.src.schemas.solow import (
     ImpulseResponseRequest,
 )
 
-router = APIRouter(prefix="/api/solow", tags=["solow"])
+router = APIRouter(
+    prefix="/api/solow", tags=["solow"], default_response_class=ORJSONResponse
+)
+
+
+@lru_cache(maxsize=512)
+def _build_solow(params: SolowParametersRequest) -> SolowGrowthModel:
+    """Build a Solow model, reusing instances for repeated parameter sets.
+
+    Request parameters are frozen and hashable, so they serve as the cache
+    key directly. Models are read-only after construction, so cached
+    instances can be shared safely between requests.
+
+    Args:
+        params: Validated model parameters
+
+    Returns:
+        Model instance for the given parameters
+    """
+    return SolowGrowthModel(params)
+
 
+@lru_cache(maxsize=256)
+def _solow_engine(params: SolowParametersRequest) -> SimulationEngine:
+    """Simulation engine for the cached model with these parameters."""
+    return SimulationEngine(_build_solow(params))
 
-@router.post("/steady-state", response_model=SteadyStateResponse)
-async def calculate_steady_state(params: SolowParametersRequest):
+
+@lru_cache(maxsize=1024)
+def _steady_state_bytes(params: SolowParametersRequest) -> bytes:
+    """Encoded JSON body of the steady state response for these parameters.
+
+    The result is a deterministic function of the parameters, so repeated
+    requests (e.g. from UI sliders) skip model arithmetic, response model
+    construction and serialization entirely.
+
+    Args:
+        params: Validated model parameters
+
+    Returns:
+        Serialized SteadyStateResponse body
+    """
+    ss = _build_solow(params).calculate_steady_state()
+    return orjson.dumps(SteadyStateResponse.model_construct(**ss._asdict()).model_dump())
+
+
+@router.post("/steady-state", responses={200: {"model": SteadyStateResponse}})
+def calculate_steady_state(params: SolowParametersRequest):
     """Calculate steady-state values for Solow model.
 
     Args:
@@ -25,20 +74,14 @@ async def calculate_steady_state(params: SolowParametersRequest):
         Steady-state capital, output, consumption, investment, growth rate
     """
     try:
-        # Convert request schema to model parameters
-        model_params = SolowParameters(**params.model_dump())
-        model = SolowGrowthModel(model_params)
-
-        # Calculate steady state
-        ss = model.calculate_steady_state()
-
-        return SteadyStateResponse(**ss)
+        # Serve cached response bytes for identical parameters
+        return Response(content=_steady_state_bytes(params), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/simulate", response_model=SimulationResponse)
-async def simulate_model(request: SimulationRequest):
+@router.post("/simulate", responses={200: {"model": SimulationResponse}})
+async def simulate_model(request: SimulationRequest, http_request: Request):
     """Run time-path simulation of Solow model.
 
     Args:
@@ -48,35 +91,42 @@ async def simulate_model(request: SimulationRequest):
         Time series of capital, output, consumption, investment
     """
     try:
-        # Create model
-        model_params = SolowParameters(**request.parameters.model_dump())
-        model = SolowGrowthModel(model_params)
-
-        # Create simulation engine
-        engine = SimulationEngine(model)
-
-        # Run simulation
-        result = engine.simulate_solow(
-            horizon=request.horizon,
-            time_step=request.time_step,
-            initial_capital=request.initial_capital,
+        # Reuse cached engine for identical parameters
+        engine = _solow_engine(request.parameters)
+
+        # Run simulation in the process pool to keep the event loop free
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            http_request.app.state.pool,
+            partial(
+                engine.simulate_solow,
+                horizon=request.horizon,
+                time_step=request.time_step,
+                initial_capital=request.initial_capital,
+                dtype=np.float32,
+            ),
         )
 
-        # Convert to response format
-        return SimulationResponse(
-            time=result.time.tolist(),
-            capital=result.states["capital"].tolist(),
-            output=result.states["output"].tolist(),
-            consumption=result.states["consumption"].tolist(),
-            investment=result.states["investment"].tolist(),
-            metadata=result.metadata,
+        # Serialize float32 arrays directly as JSON or msgpack, bypassing jsonable_encoder
+        return array_response(
+            http_request,
+            {
+                "time": as_float32(result.time),
+                "capital": as_float32(result.states["capital"]),
+                "output": as_float32(result.states["output"]),
+                "consumption": as_float32(result.states["consumption"]),
+                "investment": as_float32(result.states["investment"]),
+                "metadata": result.metadata,
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/impulse-response", response_model=SimulationResponse)
-async def calculate_impulse_response(request: ImpulseResponseRequest):
+@router.post("/impulse-response", responses={200: {"model": SimulationResponse}})
+async def calculate_impulse_response(
+    request: ImpulseResponseRequest, http_request: Request
+):
     """Calculate impulse response to parameter shock.
 
     Args:
@@ -86,29 +136,34 @@ async def calculate_impulse_response(request: ImpulseResponseRequest):
         Time series showing response to shock
     """
     try:
-        # Create model
-        model_params = SolowParameters(**request.parameters.model_dump())
-        model = SolowGrowthModel(model_params)
-
-        # Create simulation engine
-        engine = SimulationEngine(model)
-
-        # Calculate impulse response
-        result = engine.impulse_response(
-            shock_var=request.shock_var,
-            shock_size=request.shock_size,
-            horizon=request.horizon,
-            time_step=request.time_step,
+        # Reuse cached engine for identical parameters
+        engine = _solow_engine(request.parameters)
+
+        # Calculate impulse response in the process pool to keep the event loop free
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            http_request.app.state.pool,
+            partial(
+                engine.impulse_response,
+                shock_var=request.shock_var,
+                shock_size=request.shock_size,
+                horizon=request.horizon,
+                time_step=request.time_step,
+                dtype=np.float32,
+            ),
         )
 
-        # Convert to response format
-        return SimulationResponse(
-            time=result.time.tolist(),
-            capital=result.states["capital"].tolist(),
-            output=result.states["output"].tolist(),
-            consumption=result.states["consumption"].tolist(),
-            investment=result.states["investment"].tolist(),
-            metadata=result.metadata,
+        # Serialize float32 arrays directly as JSON or msgpack, bypassing jsonable_encoder
+        return array_response(
+            http_request,
+            {
+                "time": as_float32(result.time),
+                "capital": as_float32(result.states["capital"]),
+                "output": as_float32(result.states["output"]),
+                "consumption": as_float32(result.states["consumption"]),
+                "investment": as_float32(result.states["investment"]),
+                "metadata": result.metadata,
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
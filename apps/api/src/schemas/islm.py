@@ -1,56 +1,62 @@
 """Pydantic schemas for IS-LM model API requests/responses."""
 
-from pydantic import BaseModel, Field
-from typing import Dict, List
+import msgspec
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from typing import Annotated, Dict, List
+
+from packages.models.src.macroeconomic.islm import ISLMParameters
+
+# Shared OpenAPI example, built once and referenced by every request schema
+ISLM_PARAMETERS_EXAMPLE = {
+    "autonomous_consumption": 100,
+    "mpc": 0.8,
+    "autonomous_investment": 200,
+    "investment_sensitivity": 50,
+    "autonomous_money_demand": 50,
+    "income_money_demand": 0.2,
+    "interest_money_demand": 100,
+    "government_spending": 250,
+    "taxes": 200,
+    "money_supply": 1000,
+    "price_level": 1.0,
+}
+
+
+# Subclasses the domain parameters so a validated request body can be passed
+# to ISLMModel directly, without a second round of validation
+class ISLMParametersRequest(ISLMParameters):
+    """Request schema for IS-LM model parameters."""
 
+    model_config = {"json_schema_extra": {"example": ISLM_PARAMETERS_EXAMPLE}}
 
-class ISLMParametersRequest(BaseModel):
-    """Request schema for IS-LM model parameters."""
 
-    # Consumption parameters
-    autonomous_consumption: float = Field(gt=0, description="Autonomous consumption (c0)")
-    mpc: float = Field(gt=0, lt=1, description="Marginal propensity to consume (c1)")
+_Positive = Annotated[float, msgspec.Meta(gt=0)]
+_NonNegative = Annotated[float, msgspec.Meta(ge=0)]
 
-    # Investment parameters
-    autonomous_investment: float = Field(gt=0, description="Autonomous investment (i0)")
-    investment_sensitivity: float = Field(
-        gt=0, description="Investment interest rate sensitivity (i1)"
-    )
 
-    # Money demand parameters
-    autonomous_money_demand: float = Field(gt=0, description="Autonomous money demand (L0)")
-    income_money_demand: float = Field(
-        gt=0, description="Income sensitivity of money demand (L1)"
-    )
-    interest_money_demand: float = Field(
-        gt=0, description="Interest rate sensitivity of money demand (L2)"
-    )
+class ISLMParametersMsg(msgspec.Struct, frozen=True):
+    """IS-LM parameters decoded and validated by msgspec in one pass.
 
-    # Fiscal policy variables
-    government_spending: float = Field(ge=0, description="Government spending (G)")
-    taxes: float = Field(ge=0, description="Lump-sum taxes (T)")
+    Mirrors the constraints of ISLMParameters for the hot equilibrium
+    endpoint; frozen, so instances are hashable cache keys.
+    """
 
-    # Monetary policy variables
-    money_supply: float = Field(gt=0, description="Money supply (M)")
-    price_level: float = Field(gt=0, description="Price level (P)", default=1.0)
+    autonomous_consumption: _Positive
+    mpc: Annotated[float, msgspec.Meta(gt=0, lt=1)]
+    autonomous_investment: _Positive
+    investment_sensitivity: _Positive
+    autonomous_money_demand: _Positive
+    income_money_demand: _Positive
+    interest_money_demand: _Positive
+    government_spending: _NonNegative
+    taxes: _NonNegative
+    money_supply: _Positive
+    price_level: _Positive = 1.0
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "autonomous_consumption": 100,
-                "mpc": 0.8,
-                "autonomous_investment": 200,
-                "investment_sensitivity": 50,
-                "autonomous_money_demand": 50,
-                "income_money_demand": 0.2,
-                "interest_money_demand": 100,
-                "government_spending": 250,
-                "taxes": 200,
-                "money_supply": 1000,
-                "price_level": 1.0,
-            }
-        }
-    }
+
+# Lax like Pydantic's default mode, so numeric strings such as "0.8" still decode
+ISLM_PARAMETERS_DECODER = msgspec.json.Decoder(ISLMParametersMsg, strict=False)
 
 
 class EquilibriumResponse(BaseModel):
@@ -76,19 +82,7 @@ class PolicyEffectRequest(BaseModel):
     model_config = {
         "json_schema_extra": {
             "example": {
-                "parameters": {
-                    "autonomous_consumption": 100,
-                    "mpc": 0.8,
-                    "autonomous_investment": 200,
-                    "investment_sensitivity": 50,
-                    "autonomous_money_demand": 50,
-                    "income_money_demand": 0.2,
-                    "interest_money_demand": 100,
-                    "government_spending": 250,
-                    "taxes": 200,
-                    "money_supply": 1000,
-                    "price_level": 1.0,
-                },
+                "parameters": ISLM_PARAMETERS_EXAMPLE,
                 "delta_g": 100,
                 "delta_t": 0,
                 "delta_m": 0,
@@ -117,22 +111,31 @@ class SimulationRequest(BaseModel):
     )
     shock_sizes: List[float] = Field(default_factory=list, description="Size of each shock")
 
+    _shock_times_arr: np.ndarray = PrivateAttr()
+    _shock_types_arr: np.ndarray = PrivateAttr()
+    _shock_sizes_arr: np.ndarray = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _align_shocks(self) -> "SimulationRequest":
+        """Check shock lists line up and convert them to arrays once."""
+        if not len(self.shock_times) == len(self.shock_types) == len(self.shock_sizes):
+            raise ValueError(
+                "shock_times, shock_types and shock_sizes must have the same length"
+            )
+        self._shock_times_arr = np.asarray(self.shock_times, dtype=np.int64)
+        self._shock_types_arr = np.asarray(self.shock_types, dtype=str)
+        self._shock_sizes_arr = np.asarray(self.shock_sizes, dtype=np.float64)
+        return self
+
+    @property
+    def shock_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Shock times, types and sizes as aligned NumPy arrays."""
+        return self._shock_times_arr, self._shock_types_arr, self._shock_sizes_arr
+
     model_config = {
         "json_schema_extra": {
             "example": {
-                "parameters": {
-                    "autonomous_consumption": 100,
-                    "mpc": 0.8,
-                    "autonomous_investment": 200,
-                    "investment_sensitivity": 50,
-                    "autonomous_money_demand": 50,
-                    "income_money_demand": 0.2,
-                    "interest_money_demand": 100,
-                    "government_spending": 250,
-                    "taxes": 200,
-                    "money_supply": 1000,
-                    "price_level": 1.0,
-                },
+                "parameters": ISLM_PARAMETERS_EXAMPLE,
                 "horizon": 30,
                 "shock_times": [10, 20],
                 "shock_types": ["G", "M"],
@@ -164,19 +167,7 @@ class ImpulseResponseRequest(BaseModel):
     model_config = {
         "json_schema_extra": {
             "example": {
-                "parameters": {
-                    "autonomous_consumption": 100,
-                    "mpc": 0.8,
-                    "autonomous_investment": 200,
-                    "investment_sensitivity": 50,
-                    "autonomous_money_demand": 50,
-                    "income_money_demand": 0.2,
-                    "interest_money_demand": 100,
-                    "government_spending": 250,
-                    "taxes": 200,
-                    "money_supply": 1000,
-                    "price_level": 1.0,
-                },
+                "parameters": ISLM_PARAMETERS_EXAMPLE,
                 "shock_type": "G",
                 "shock_size": 100,
                 "horizon": 30,
@@ -3,27 +3,25 @@
 from pydantic import BaseModel, Field
 from typing import Dict, List
 
-
-class SolowParametersRequest(BaseModel):
+from packages.models.src.macroeconomic.solow import SolowParameters
+
+# Shared OpenAPI example, built once and referenced by every request schema
+SOLOW_PARAMETERS_EXAMPLE = {
+    "savings_rate": 0.2,
+    "depreciation_rate": 0.05,
+    "population_growth": 0.01,
+    "tech_growth": 0.02,
+    "alpha": 0.33,
+    "initial_capital": 1.0,
+}
+
+
+# Subclasses the domain parameters so a validated request body can be passed
+# to SolowGrowthModel directly, without a second round of validation
+class SolowParametersRequest(SolowParameters):
     """Request schema for Solow model parameters."""
 
-    savings_rate: float = Field(gt=0, lt=1, description="Savings rate (s)")
-    depreciation_rate: float = Field(gt=0, lt=1, description="Depreciation rate (δ)")
-    population_growth: float = Field(ge=0, lt=0.1, description="Population growth (n)")
-    tech_growth: float = Field(ge=0, lt=0.1, description="Technology growth (g)")
-    alpha: float = Field(gt=0, lt=1, description="Capital share (α)")
-    initial_capital: float = Field(gt=0, description="Initial capital k(0)")
-
-    model_config = {"json_schema_extra": {
-        "example": {
-            "savings_rate": 0.2,
-            "depreciation_rate": 0.05,
-            "population_growth": 0.01,
-            "tech_growth": 0.02,
-            "alpha": 0.33,
-            "initial_capital": 1.0,
-        }
-    }}
+    model_config = {"json_schema_extra": {"example": SOLOW_PARAMETERS_EXAMPLE}}
 
 
 class SteadyStateResponse(BaseModel):
@@ -42,18 +40,11 @@ class SimulationRequest(BaseModel):
     parameters: SolowParametersRequest
     horizon: int = Field(gt=0, le=500, description="Simulation horizon (periods)")
     time_step: float = Field(gt=0, le=1, default=0.1, description="Time step")
-    initial_capital: float | None = Field(None, description="Override initial capital")
+    initial_capital: float | None = Field(None, gt=0, description="Override initial capital")
 
     model_config = {"json_schema_extra": {
         "example": {
-            "parameters": {
-                "savings_rate": 0.2,
-                "depreciation_rate": 0.05,
-                "population_growth": 0.01,
-                "tech_growth": 0.02,
-                "alpha": 0.33,
-                "initial_capital": 1.0,
-            },
+            "parameters": SOLOW_PARAMETERS_EXAMPLE,
             "horizon": 100,
             "time_step": 0.5,
         }
@@ -82,14 +73,7 @@ class ImpulseResponseRequest(BaseModel):
 
     model_config = {"json_schema_extra": {
         "example": {
-            "parameters": {
-                "savings_rate": 0.2,
-                "depreciation_rate": 0.05,
-                "population_growth": 0.01,
-                "tech_growth": 0.02,
-                "alpha": 0.33,
-                "initial_capital": 1.0,
-            },
+            "parameters": SOLOW_PARAMETERS_EXAMPLE,
             "shock_var": "savings_rate",
             "shock_size": 0.1,
             "horizon": 100,
@@ -0,0 +1,16 @@
+"""Shared fixtures for API route tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by all API tests, with the app lifespan running."""
+    from apps.api.src.main import app
+
+    # Build the OpenAPI schema once; FastAPI reuses app.openapi_schema afterwards
+    app.openapi()
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,39 +1,35 @@
 """Tests for IS-LM model API routes."""
 
+import msgpack
+import numpy as np
 import pytest
-from fastapi.testclient import TestClient
-from apps.api.src.main import app
 
-client = TestClient(app)
+# Standard IS-LM parameters for testing
+STANDARD_PARAMS = {
+    "autonomous_consumption": 100,
+    "mpc": 0.8,
+    "autonomous_investment": 200,
+    "investment_sensitivity": 50,
+    "autonomous_money_demand": 50,
+    "income_money_demand": 0.2,
+    "interest_money_demand": 100,
+    "government_spending": 250,
+    "taxes": 200,
+    "money_supply": 1000,
+    "price_level": 1.0,
+}
 
 
 class TestISLMRoutes:
     """Test IS-LM API endpoints."""
 
-    @pytest.fixture
-    def standard_params(self):
-        """Standard IS-LM parameters for testing."""
-        return {
-            "autonomous_consumption": 100,
-            "mpc": 0.8,
-            "autonomous_investment": 200,
-            "investment_sensitivity": 50,
-            "autonomous_money_demand": 50,
-            "income_money_demand": 0.2,
-            "interest_money_demand": 100,
-            "government_spending": 250,
-            "taxes": 200,
-            "money_supply": 1000,
-            "price_level": 1.0,
-        }
-
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
-    def test_islm_health_check(self):
+    def test_islm_health_check(self, client):
         """Test IS-LM-specific health endpoint."""
         response = client.get("/api/islm/health")
         assert response.status_code == 200
@@ -41,9 +37,9 @@ class TestISLMRoutes:
         assert data["status"] == "healthy"
         assert data["model"] == "islm"
 
-    def test_calculate_equilibrium(self, standard_params):
+    def test_calculate_equilibrium(self, client):
         """Test equilibrium calculation endpoint."""
-        response = client.post("/api/islm/equilibrium", json=standard_params)
+        response = client.post("/api/islm/equilibrium", json=STANDARD_PARAMS)
 
         assert response.status_code == 200
         data = response.json()
@@ -67,16 +63,34 @@ class TestISLMRoutes:
         expected_multiplier = 1 / (1 - 0.8)
         assert abs(data["multiplier"] - expected_multiplier) < 0.01
 
-    def test_fiscal_expansion_effect(self, standard_params):
-        """Test fiscal expansion effect endpoint."""
-        request_data = {
-            "parameters": standard_params,
-            "delta_g": 100,
-            "delta_t": 0,
-            "delta_m": 0,
-        }
+    def test_equilibrium_numeric_strings(self, client):
+        """Numeric strings are coerced, as on the other IS-LM endpoints."""
+        params = {**STANDARD_PARAMS, "mpc": "0.8", "money_supply": "1000"}
+        response = client.post("/api/islm/equilibrium", json=params)
 
-        response = client.post("/api/islm/fiscal-effect", json=request_data)
+        assert response.status_code == 200
+        expected = client.post("/api/islm/equilibrium", json=STANDARD_PARAMS).json()
+        assert response.json() == expected
+
+    @pytest.mark.parametrize(
+        "endpoint, deltas, sign_income, sign_rate, sign_investment",
+        [
+            # Fiscal expansion raises income and rates, crowding out investment
+            ("fiscal-effect", {"delta_g": 100, "delta_t": 0, "delta_m": 0}, 1, 1, -1),
+            # Tax increase lowers income and rates
+            ("fiscal-effect", {"delta_g": 0, "delta_t": 100, "delta_m": 0}, -1, -1, None),
+            # Monetary expansion raises income, lowers rates, stimulates investment
+            ("monetary-effect", {"delta_g": 0, "delta_t": 0, "delta_m": 200}, 1, -1, 1),
+        ],
+        ids=["fiscal_expansion", "tax_increase", "monetary_expansion"],
+    )
+    def test_policy_effect(
+        self, client, endpoint, deltas, sign_income, sign_rate, sign_investment
+    ):
+        """Test fiscal and monetary policy effect endpoints."""
+        request_data = {"parameters": STANDARD_PARAMS, **deltas}
+
+        response = client.post(f"/api/islm/{endpoint}", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -87,57 +101,15 @@ class TestISLMRoutes:
         assert "delta_consumption" in data
         assert "delta_investment" in data
 
-        # Fiscal expansion should increase income
-        assert data["delta_income"] > 0
-
-        # Interest rate should increase
-        assert data["delta_interest_rate"] > 0
-
-        # Investment should decrease (crowding out)
-        assert data["delta_investment"] < 0
-
-    def test_tax_increase_effect(self, standard_params):
-        """Test tax increase effect endpoint."""
-        request_data = {
-            "parameters": standard_params,
-            "delta_g": 0,
-            "delta_t": 100,
-            "delta_m": 0,
-        }
-
-        response = client.post("/api/islm/fiscal-effect", json=request_data)
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Tax increase should decrease income
-        assert data["delta_income"] < 0
-
-        # Interest rate should decrease
-        assert data["delta_interest_rate"] < 0
-
-    def test_monetary_expansion_effect(self, standard_params):
-        """Test monetary expansion effect endpoint."""
-        request_data = {"parameters": standard_params, "delta_m": 200, "delta_g": 0, "delta_t": 0}
-
-        response = client.post("/api/islm/monetary-effect", json=request_data)
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Monetary expansion should increase income
-        assert data["delta_income"] > 0
-
-        # Interest rate should decrease
-        assert data["delta_interest_rate"] < 0
-
-        # Investment should increase
-        assert data["delta_investment"] > 0
+        assert sign_income * data["delta_income"] > 0
+        assert sign_rate * data["delta_interest_rate"] > 0
+        if sign_investment is not None:
+            assert sign_investment * data["delta_investment"] > 0
 
-    def test_simulate_no_shocks(self, standard_params):
+    def test_simulate_no_shocks(self, client):
         """Test simulation endpoint without shocks."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "horizon": 20,
             "shock_times": [],
             "shock_types": [],
@@ -164,12 +136,12 @@ class TestISLMRoutes:
 
         # Without shocks, values should be constant
         income_values = data["income"]
-        assert all(abs(y - income_values[0]) < 0.001 for y in income_values)
+        assert np.allclose(income_values, income_values[0], rtol=0, atol=1e-3)
 
-    def test_simulate_with_fiscal_shock(self, standard_params):
+    def test_simulate_with_fiscal_shock(self, client):
         """Test simulation with fiscal policy shock."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "horizon": 30,
             "shock_times": [10],
             "shock_types": ["G"],
@@ -189,10 +161,10 @@ class TestISLMRoutes:
         interest = data["interest_rate"]
         assert interest[15] > interest[5]
 
-    def test_simulate_with_monetary_shock(self, standard_params):
+    def test_simulate_with_monetary_shock(self, client):
         """Test simulation with monetary policy shock."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "horizon": 30,
             "shock_times": [10],
             "shock_types": ["M"],
@@ -212,10 +184,10 @@ class TestISLMRoutes:
         interest = data["interest_rate"]
         assert interest[15] < interest[5]
 
-    def test_simulate_multiple_shocks(self, standard_params):
+    def test_simulate_multiple_shocks(self, client):
         """Test simulation with multiple shocks."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "horizon": 40,
             "shock_times": [10, 20, 30],
             "shock_types": ["G", "M", "T"],
@@ -232,10 +204,10 @@ class TestISLMRoutes:
         assert data["metadata"]["shock_types"] == ["G", "M", "T"]
         assert data["metadata"]["shock_sizes"] == [100, 200, 50]
 
-    def test_impulse_response_fiscal(self, standard_params):
+    def test_impulse_response_fiscal(self, client):
         """Test fiscal impulse response endpoint."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "shock_type": "G",
             "shock_size": 100,
             "horizon": 20,
@@ -260,10 +232,10 @@ class TestISLMRoutes:
         income = data["income"]
         assert income[2] > income[0]
 
-    def test_impulse_response_monetary(self, standard_params):
+    def test_impulse_response_monetary(self, client):
         """Test monetary impulse response endpoint."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "shock_type": "M",
             "shock_size": 200,
             "horizon": 20,
@@ -282,7 +254,7 @@ class TestISLMRoutes:
         income = data["income"]
         assert income[2] > income[0]
 
-    def test_invalid_parameters(self):
+    def test_invalid_parameters(self, client):
         """Test endpoint with invalid parameters."""
         invalid_params = {
             "autonomous_consumption": -100,  # Negative (invalid)
@@ -302,7 +274,20 @@ class TestISLMRoutes:
         # Should return validation error
         assert response.status_code == 422
 
-    def test_mpc_out_of_bounds(self):
+        # Same per-field error location as the Pydantic-validated endpoints
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body", "autonomous_consumption"]
+        assert error["input"] == -100
+
+    def test_missing_parameter_location(self, client):
+        """Missing fields are reported at their own body location."""
+        params = {k: v for k, v in STANDARD_PARAMS.items() if k != "mpc"}
+        response = client.post("/api/islm/equilibrium", json=params)
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "mpc"]
+
+    def test_mpc_out_of_bounds(self, client):
         """Test endpoint with MPC out of valid range."""
         invalid_params = {
             "autonomous_consumption": 100,
@@ -321,3 +306,65 @@ class TestISLMRoutes:
 
         # Should return validation error
         assert response.status_code == 422
+
+    def test_simulate_msgpack(self, client):
+        """Simulation should return typed binary arrays when msgpack is accepted."""
+        request_data = {
+            "parameters": STANDARD_PARAMS,
+            "horizon": 20,
+            "shock_times": [10],
+            "shock_types": ["G"],
+            "shock_sizes": [100],
+        }
+
+        response = client.post(
+            "/api/islm/simulate",
+            json=request_data,
+            headers={"Accept": "application/msgpack"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        data = msgpack.unpackb(response.content)
+
+        income_field = data["income"]
+        income = np.frombuffer(income_field["data"], dtype=income_field["dtype"])
+        assert income_field["shape"] == [21]
+
+        json_income = client.post("/api/islm/simulate", json=request_data).json()["income"]
+        assert np.allclose(income, json_income)
+        assert data["metadata"]["shock_times"] == [10]
+
+    def test_simulate_misaligned_shocks(self, client):
+        """Shock lists of different lengths should be rejected at validation."""
+        request_data = {
+            "parameters": STANDARD_PARAMS,
+            "horizon": 20,
+            "shock_times": [5, 10],
+            "shock_types": ["G"],
+            "shock_sizes": [100, 50],
+        }
+
+        response = client.post("/api/islm/simulate", json=request_data)
+
+        assert response.status_code == 422
+
+    def test_simulate_gzip(self, client):
+        """Large simulation payloads should be gzip-compressed when accepted."""
+        request_data = {
+            "parameters": STANDARD_PARAMS,
+            "horizon": 100,
+            "shock_times": [10],
+            "shock_types": ["G"],
+            "shock_sizes": [100],
+        }
+
+        response = client.post(
+            "/api/islm/simulate",
+            json=request_data,
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["income"]) == 101
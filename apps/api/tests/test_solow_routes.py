@@ -1,34 +1,26 @@
 """Tests for Solow model API routes."""
 
-import pytest
-from fastapi.testclient import TestClient
-from apps.api.src.main import app
-
-client = TestClient(app)
+# Standard Solow parameters for testing
+STANDARD_PARAMS = {
+    "savings_rate": 0.2,
+    "depreciation_rate": 0.05,
+    "population_growth": 0.01,
+    "tech_growth": 0.02,
+    "alpha": 0.33,
+    "initial_capital": 1.0,
+}
 
 
 class TestSolowRoutes:
     """Test Solow API endpoints."""
 
-    @pytest.fixture
-    def standard_params(self):
-        """Standard Solow parameters for testing."""
-        return {
-            "savings_rate": 0.2,
-            "depreciation_rate": 0.05,
-            "population_growth": 0.01,
-            "tech_growth": 0.02,
-            "alpha": 0.33,
-            "initial_capital": 1.0,
-        }
-
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
-    def test_solow_health_check(self):
+    def test_solow_health_check(self, client):
         """Test Solow-specific health endpoint."""
         response = client.get("/api/solow/health")
         assert response.status_code == 200
@@ -36,9 +28,9 @@ class TestSolowRoutes:
         assert data["status"] == "healthy"
         assert data["model"] == "solow"
 
-    def test_calculate_steady_state(self, standard_params):
+    def test_calculate_steady_state(self, client):
         """Test steady state calculation endpoint."""
-        response = client.post("/api/solow/steady-state", json=standard_params)
+        response = client.post("/api/solow/steady-state", json=STANDARD_PARAMS)
 
         assert response.status_code == 200
         data = response.json()
@@ -57,10 +49,22 @@ class TestSolowRoutes:
         assert data["investment"] > 0
         assert data["growth_rate"] == 0.02  # Should equal tech growth
 
-    def test_simulate_model(self, standard_params):
+    def test_simulate_rejects_nonpositive_capital(self, client):
+        """Initial capital overrides must be positive."""
+        request_data = {
+            "parameters": STANDARD_PARAMS,
+            "horizon": 10,
+            "initial_capital": 0,
+        }
+
+        response = client.post("/api/solow/simulate", json=request_data)
+
+        assert response.status_code == 422
+
+    def test_simulate_model(self, client):
         """Test simulation endpoint."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "horizon": 50,
             "time_step": 1.0,
         }
@@ -89,17 +93,17 @@ class TestSolowRoutes:
         assert data["time"][0] == 0
 
         # Check capital converges (last value close to steady state)
-        ss_response = client.post("/api/solow/steady-state", json=standard_params)
+        ss_response = client.post("/api/solow/steady-state", json=STANDARD_PARAMS)
         ss_capital = ss_response.json()["capital"]
         final_capital = data["capital"][-1]
 
         # Should be within 10% of steady state after 50 periods
         assert abs(final_capital - ss_capital) / ss_capital < 0.10
 
-    def test_impulse_response(self, standard_params):
+    def test_impulse_response(self, client):
         """Test impulse response endpoint."""
         request_data = {
-            "parameters": standard_params,
+            "parameters": STANDARD_PARAMS,
             "shock_var": "savings_rate",
             "shock_size": 0.1,
             "horizon": 50,
@@ -126,7 +130,7 @@ class TestSolowRoutes:
         final_capital = data["capital"][-1]
         assert final_capital > original_ss
 
-    def test_invalid_parameters(self):
+    def test_invalid_parameters(self, client):
         """Test validation of invalid parameters."""
         invalid_params = {
             "savings_rate": 1.5,  # Invalid: must be < 1
@@ -140,7 +144,7 @@ class TestSolowRoutes:
         response = client.post("/api/solow/steady-state", json=invalid_params)
         assert response.status_code == 422  # Validation error
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test root endpoint returns API info."""
         response = client.get("/")
         assert response.status_code == 200
@@ -148,7 +152,7 @@ class TestSolowRoutes:
         assert "version" in data
         assert "docs" in data
 
-    def test_openapi_docs(self):
+    def test_openapi_docs(self, client):
         """Test that OpenAPI docs are available."""
         response = client.get("/docs")
         assert response.status_code == 200
@@ -158,3 +162,40 @@ class TestSolowRoutes:
         openapi_spec = response.json()
         assert "paths" in openapi_spec
         assert "/api/solow/steady-state" in openapi_spec["paths"]
+
+    def test_cors_preflight(self, client):
+        """Preflight from the frontend origin should be answered directly."""
+        response = client.options(
+            "/api/solow/simulate",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type"
+
+    def test_cors_preflight_foreign_origin(self, client):
+        """Preflight from any other origin should be rejected."""
+        response = client.options(
+            "/api/solow/simulate",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS origin"
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_cors_headers(self, client):
+        """Only the frontend origin should receive CORS headers."""
+        response = client.get("/health", headers={"Origin": "http://localhost:3000"})
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+        response = client.get("/health", headers={"Origin": "http://example.com"})
+        assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,21 @@
+"""
+Optional Numba support.
+
+Numba is an optional dependency. When it is not installed, ``njit`` leaves
+functions uncompiled and ``prange`` is plain ``range``, so kernels run as
+ordinary Python with identical results.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "prange"]
@@ -0,0 +1,82 @@
+"""
+Compiled closed-form IS-LM equilibrium.
+
+The IS-LM system is linear in (Y, r), so equilibrium has an exact solution.
+Keeping it in a scalar Numba kernel lets the equilibrium, policy-effect and
+batch methods share one compiled implementation.
+"""
+
+from packages.models.src._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def islm_solve(c0, c1, i0, i1, L0, L1, L2, G, T, M, P):
+    """Solve the IS-LM system in closed form.
+
+    IS: (1 - c1)·Y + i1·r = c0 - c1·T + i0 + G
+    LM: L1·Y - L2·r = M/P - L0
+
+    The 2x2 system is solved directly with Cramer's rule.
+
+    Args:
+        c0: Autonomous consumption
+        c1: Marginal propensity to consume
+        i0: Autonomous investment
+        i1: Investment sensitivity to the interest rate
+        L0: Autonomous money demand
+        L1: Income sensitivity of money demand
+        L2: Interest rate sensitivity of money demand
+        G: Government spending
+        T: Taxes
+        M: Nominal money supply
+        P: Price level
+
+    Returns:
+        Tuple (Y, r, C, I, AD, M/P, multiplier)
+    """
+    real_money = M / P
+    a = 1.0 - c1
+    b = i1
+    c = L1
+    d = -L2
+    rhs1 = c0 - c1 * T + i0 + G
+    rhs2 = real_money - L0
+    det = a * d - b * c
+    Y = (rhs1 * d - b * rhs2) / det
+    r = (a * rhs2 - c * rhs1) / det
+    C = c0 + c1 * (Y - T)
+    I = i0 - i1 * r
+    AD = C + I + G
+    multiplier = 1.0 / (1.0 - c1)
+    return Y, r, C, I, AD, real_money, multiplier
+
+
+@njit(cache=True, fastmath=True)
+def islm_solve_path(c0, c1, i0, i1, L0, L1, L2, G, T, M, P, out_y, out_r, out_c, out_i):
+    """Solve the IS-LM equilibrium for each entry of a policy path or sweep.
+
+    Args:
+        c0: Autonomous consumption
+        c1: Marginal propensity to consume
+        i0: Autonomous investment
+        i1: Investment sensitivity to the interest rate
+        L0: Autonomous money demand
+        L1: Income sensitivity of money demand
+        L2: Interest rate sensitivity of money demand
+        G: Government spending per period
+        T: Taxes per period
+        M: Nominal money supply per period
+        P: Price level
+        out_y: Output array for income, same length as G
+        out_r: Output array for the interest rate, same length as G
+        out_c: Output array for consumption, same length as G
+        out_i: Output array for investment, same length as G
+    """
+    for j in range(G.shape[0]):
+        y, r, c, inv, _, _, _ = islm_solve(
+            c0, c1, i0, i1, L0, L1, L2, G[j], T[j], M[j], P
+        )
+        out_y[j] = y
+        out_r[j] = r
+        out_c[j] = c
+        out_i[j] = inv
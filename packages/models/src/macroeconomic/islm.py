@@ -12,10 +12,13 @@ References:
 - Blanchard, O. (2017). "Macroeconomics" (7th edition), Chapter 5
 """
 
+from functools import lru_cache
+
 import numpy as np
 from pydantic import BaseModel, Field
-from typing import Dict, Optional
-from scipy.optimize import fsolve
+from typing import Dict, NamedTuple, Optional
+
+from packages.models.src.macroeconomic._islm_kernel import islm_solve, islm_solve_path
 
 
 class ISLMParameters(BaseModel):
@@ -76,6 +79,22 @@ class ISLMParameters(BaseModel):
     model_config = {"frozen": True}
 
 
+class _Coefficients(NamedTuple):
+    """IS-LM parameters unpacked into plain floats, in kernel argument order."""
+
+    c0: float
+    c1: float
+    i0: float
+    i1: float
+    L0: float
+    L1: float
+    L2: float
+    G: float
+    T: float
+    M: float
+    P: float
+
+
 class ISLMModel:
     """
     IS-LM model implementation.
@@ -97,6 +116,19 @@ class ISLMModel:
             params: Model parameters (immutable)
         """
         self.params = params
+        self._coeffs = _Coefficients(
+            params.autonomous_consumption,
+            params.mpc,
+            params.autonomous_investment,
+            params.investment_sensitivity,
+            params.autonomous_money_demand,
+            params.income_money_demand,
+            params.interest_money_demand,
+            params.government_spending,
+            params.taxes,
+            params.money_supply,
+            params.price_level,
+        )
 
     def consumption(self, income: float) -> float:
         """Calculate consumption given income.
@@ -109,11 +141,8 @@ class ISLMModel:
         Returns:
             Consumption (C)
         """
-        disposable_income = income - self.params.taxes
-        return (
-            self.params.autonomous_consumption
-            + self.params.mpc * disposable_income
-        )
+        k = self._coeffs
+        return k.c0 + k.c1 * (income - k.T)
 
     def investment(self, interest_rate: float) -> float:
         """Calculate investment given interest rate.
@@ -126,10 +155,8 @@ class ISLMModel:
         Returns:
             Investment (I)
         """
-        return (
-            self.params.autonomous_investment
-            - self.params.investment_sensitivity * interest_rate
-        )
+        k = self._coeffs
+        return k.i0 - k.i1 * interest_rate
 
     def money_demand(self, income: float, interest_rate: float) -> float:
         """Calculate real money demand.
@@ -143,11 +170,8 @@ class ISLMModel:
         Returns:
             Real money demand (M^d/P)
         """
-        return (
-            self.params.autonomous_money_demand
-            + self.params.income_money_demand * income
-            - self.params.interest_money_demand * interest_rate
-        )
+        k = self._coeffs
+        return k.L0 + k.L1 * income - k.L2 * interest_rate
 
     def real_money_supply(self) -> float:
         """Calculate real money supply.
@@ -157,7 +181,7 @@ class ISLMModel:
         Returns:
             Real money supply (M/P)
         """
-        return self.params.money_supply / self.params.price_level
+        return self._coeffs.M / self._coeffs.P
 
     def is_curve(self, interest_rate: float) -> float:
         """Calculate output on IS curve for given interest rate.
@@ -172,15 +196,8 @@ class ISLMModel:
         Returns:
             Output level (Y) satisfying IS curve
         """
-        numerator = (
-            self.params.autonomous_consumption
-            - self.params.mpc * self.params.taxes
-            + self.params.autonomous_investment
-            - self.params.investment_sensitivity * interest_rate
-            + self.params.government_spending
-        )
-        denominator = 1 - self.params.mpc
-        return numerator / denominator
+        k = self._coeffs
+        return (k.c0 - k.c1 * k.T + k.i0 - k.i1 * interest_rate + k.G) / (1 - k.c1)
 
     def lm_curve(self, income: float) -> float:
         """Calculate interest rate on LM curve for given income.
@@ -195,24 +212,23 @@ class ISLMModel:
         Returns:
             Interest rate (r) satisfying LM curve
         """
-        numerator = (
-            self.params.autonomous_money_demand
-            + self.params.income_money_demand * income
-            - self.real_money_supply()
-        )
-        return numerator / self.params.interest_money_demand
+        k = self._coeffs
+        return (k.L0 + k.L1 * income - k.M / k.P) / k.L2
 
     def calculate_equilibrium(
         self, initial_guess: Optional[tuple[float, float]] = None
     ) -> Dict[str, float]:
-        """Calculate IS-LM equilibrium numerically.
+        """Calculate IS-LM equilibrium.
 
         Solves the system:
         - IS: Y = c0 + c1(Y - T) + i0 - i1·r + G
         - LM: M/P = L0 + L1·Y - L2·r
 
+        The system is linear, so it is solved exactly in closed form.
+
         Args:
-            initial_guess: Optional (Y, r) starting point for solver
+            initial_guess: Unused; kept for backward compatibility with the
+                former numerical solver
 
         Returns:
             Dictionary with equilibrium values:
@@ -224,49 +240,8 @@ class ISLMModel:
             - real_money_supply: Real money supply (M/P)
             - multiplier: Fiscal multiplier (1/(1-c1))
         """
-        if initial_guess is None:
-            # Use simple heuristic for initial guess
-            y0 = (
-                self.params.autonomous_consumption
-                + self.params.autonomous_investment
-                + self.params.government_spending
-            )
-            r0 = 0.05  # 5% interest rate
-            initial_guess = (y0, r0)
-
-        def equations(vars):
-            """System of equations to solve."""
-            Y, r = vars
-
-            # IS curve residual: Y - [c0 + c1(Y-T) + i0 - i1·r + G] = 0
-            is_residual = Y - (
-                self.params.autonomous_consumption
-                + self.params.mpc * (Y - self.params.taxes)
-                + self.params.autonomous_investment
-                - self.params.investment_sensitivity * r
-                + self.params.government_spending
-            )
-
-            # LM curve residual: M/P - [L0 + L1·Y - L2·r] = 0
-            lm_residual = self.real_money_supply() - (
-                self.params.autonomous_money_demand
-                + self.params.income_money_demand * Y
-                - self.params.interest_money_demand * r
-            )
-
-            return [is_residual, lm_residual]
-
-        # Solve system
-        solution = fsolve(equations, initial_guess)
-        Y_star, r_star = solution
-
-        # Calculate equilibrium quantities
-        C_star = self.consumption(Y_star)
-        I_star = self.investment(r_star)
-        AD_star = C_star + I_star + self.params.government_spending
-
-        # Fiscal multiplier
-        multiplier = 1 / (1 - self.params.mpc)
+        equilibrium = _equilibrium_cached(self._coeffs)
+        Y_star, r_star, C_star, I_star, AD_star, real_money, multiplier = equilibrium
 
         return {
             "income": float(Y_star),
@@ -274,10 +249,45 @@ class ISLMModel:
             "consumption": float(C_star),
             "investment": float(I_star),
             "aggregate_demand": float(AD_star),
-            "real_money_supply": float(self.real_money_supply()),
+            "real_money_supply": float(real_money),
             "multiplier": float(multiplier),
         }
 
+    def batch_equilibrium(
+        self, government_spending, taxes, money_supply
+    ) -> Dict[str, np.ndarray]:
+        """Calculate equilibria for many policy settings at once.
+
+        Behavioral coefficients come from the model parameters; the policy
+        inputs broadcast against each other, so scalars may be mixed with
+        arrays (e.g. a per-period spending path with constant taxes), and
+        the results take the broadcast shape.
+
+        Args:
+            government_spending: Government spending (G) per scenario
+            taxes: Taxes (T) per scenario
+            money_supply: Nominal money supply (M) per scenario
+
+        Returns:
+            Dictionary of arrays with income, interest_rate, consumption
+            and investment for each scenario
+        """
+        G, T, M = np.broadcast_arrays(government_spending, taxes, money_supply)
+        shape = G.shape
+        G, T, M = (np.ascontiguousarray(a, dtype=np.float64).ravel() for a in (G, T, M))
+        k = self._coeffs
+        paths = np.empty((4, G.size))
+        islm_solve_path(
+            k.c0, k.c1, k.i0, k.i1, k.L0, k.L1, k.L2, G, T, M, k.P, *paths
+        )
+        income, interest_rate, consumption, investment = paths.reshape((4,) + shape)
+        return {
+            "income": income,
+            "interest_rate": interest_rate,
+            "consumption": consumption,
+            "investment": investment,
+        }
+
     def fiscal_expansion_effect(
         self, delta_g: float, delta_t: float = 0.0
     ) -> Dict[str, float]:
@@ -294,27 +304,10 @@ class ISLMModel:
             - delta_consumption: Change in consumption
             - delta_investment: Change in investment (crowding out)
         """
-        # Original equilibrium
-        original = self.calculate_equilibrium()
-
-        # New parameters with fiscal policy change
-        new_params = self.params.model_copy(
-            update={
-                "government_spending": self.params.government_spending + delta_g,
-                "taxes": self.params.taxes + delta_t,
-            }
-        )
-        new_model = ISLMModel(new_params)
-        new_equilibrium = new_model.calculate_equilibrium()
-
-        return {
-            "delta_income": new_equilibrium["income"] - original["income"],
-            "delta_interest_rate": new_equilibrium["interest_rate"]
-            - original["interest_rate"],
-            "delta_consumption": new_equilibrium["consumption"]
-            - original["consumption"],
-            "delta_investment": new_equilibrium["investment"] - original["investment"],
-        }
+        k = self._coeffs
+        original = _equilibrium_cached(k)
+        shocked = islm_solve(*k._replace(G=k.G + delta_g, T=k.T + delta_t))
+        return _policy_effect(original, shocked)
 
     def monetary_expansion_effect(self, delta_m: float) -> Dict[str, float]:
         """Calculate effect of monetary policy change.
@@ -329,24 +322,10 @@ class ISLMModel:
             - delta_consumption: Change in consumption
             - delta_investment: Change in investment
         """
-        # Original equilibrium
-        original = self.calculate_equilibrium()
-
-        # New parameters with monetary policy change
-        new_params = self.params.model_copy(
-            update={"money_supply": self.params.money_supply + delta_m}
-        )
-        new_model = ISLMModel(new_params)
-        new_equilibrium = new_model.calculate_equilibrium()
-
-        return {
-            "delta_income": new_equilibrium["income"] - original["income"],
-            "delta_interest_rate": new_equilibrium["interest_rate"]
-            - original["interest_rate"],
-            "delta_consumption": new_equilibrium["consumption"]
-            - original["consumption"],
-            "delta_investment": new_equilibrium["investment"] - original["investment"],
-        }
+        k = self._coeffs
+        original = _equilibrium_cached(k)
+        shocked = islm_solve(*k._replace(M=k.M + delta_m))
+        return _policy_effect(original, shocked)
 
     def is_liquidity_trap(self, threshold: float = 0.001) -> bool:
         """Check if economy is in liquidity trap.
@@ -360,5 +339,42 @@ class ISLMModel:
         Returns:
             True if in liquidity trap, False otherwise
         """
-        equilibrium = self.calculate_equilibrium()
-        return equilibrium["interest_rate"] < threshold
+        # Only r* is needed: Cramer's rule for the second unknown of IS-LM
+        k = self._coeffs
+        a = 1 - k.c1
+        det = -a * k.L2 - k.i1 * k.L1
+        r_star = (a * (k.M / k.P - k.L0) - k.L1 * (k.c0 - k.c1 * k.T + k.i0 + k.G)) / det
+        return r_star < threshold
+
+
+@lru_cache(maxsize=256)
+def _equilibrium_cached(coeffs: _Coefficients) -> tuple[float, ...]:
+    """Equilibrium kernel result, memoized on the coefficient tuple.
+
+    Args:
+        coeffs: Model coefficients in kernel argument order
+
+    Returns:
+        Tuple (Y, r, C, I, AD, M/P, multiplier)
+    """
+    return islm_solve(*coeffs)
+
+
+def _policy_effect(
+    original: tuple[float, ...], shocked: tuple[float, ...]
+) -> Dict[str, float]:
+    """Difference between two equilibrium kernel results.
+
+    Args:
+        original: Kernel output before the policy change
+        shocked: Kernel output after the policy change
+
+    Returns:
+        Dictionary with changes in income, interest rate, consumption, investment
+    """
+    return {
+        "delta_income": float(shocked[0] - original[0]),
+        "delta_interest_rate": float(shocked[1] - original[1]),
+        "delta_consumption": float(shocked[2] - original[2]),
+        "delta_investment": float(shocked[3] - original[3]),
+    }
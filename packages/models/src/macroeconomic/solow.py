@@ -9,9 +9,17 @@ References:
 - Swan, T. W. (1956). "Economic Growth and Capital Accumulation"
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 from pydantic import BaseModel, Field
-from typing import Dict
+from typing import NamedTuple
+
+from packages.models.src.macroeconomic._solow_kernel import (
+    solow_simulate,
+    solow_steady_state_batch,
+)
 
 
 class SolowParameters(BaseModel):
@@ -36,6 +44,40 @@ class SolowParameters(BaseModel):
     model_config = {"frozen": True}  # Immutable parameters
 
 
+class SteadyState(NamedTuple):
+    """Steady-state values per effective worker.
+
+    Attributes:
+        capital: k* (capital per effective worker)
+        output: y* (output per effective worker)
+        consumption: c* (consumption per effective worker)
+        investment: i* (investment per effective worker)
+        growth_rate: Steady-state growth rate of output per worker
+    """
+
+    capital: float
+    output: float
+    consumption: float
+    investment: float
+    growth_rate: float
+
+
+class GoldenRule(NamedTuple):
+    """Golden Rule steady state (maximizes consumption).
+
+    Attributes:
+        capital: Golden Rule capital
+        output: Golden Rule output
+        consumption: Maximum steady-state consumption
+        savings_rate: Required savings rate for Golden Rule
+    """
+
+    capital: float
+    output: float
+    consumption: float
+    savings_rate: float
+
+
 class SolowGrowthModel:
     """
     Solow-Swan growth model implementation.
@@ -60,18 +102,76 @@ class SolowGrowthModel:
         """
         self.params = params
 
-    def production(self, capital: float) -> float:
+        # Plain-float copies of the parameters used in hot expressions
+        self._alpha = float(params.alpha)
+        self._s = float(params.savings_rate)
+        self._eff_dep = (
+            params.population_growth + params.tech_growth + params.depreciation_rate
+        )
+
+        # Parameters are frozen, so steady-state quantities are fixed too
+        self._one_minus_alpha_inv = 1.0 / (1.0 - self._alpha)
+        self._k_star = (self._s / self._eff_dep) ** self._one_minus_alpha_inv
+        self._y_star = self._k_star**self._alpha
+        self._k_gold = (self._alpha / self._eff_dep) ** self._one_minus_alpha_inv
+        self._y_gold = self._k_gold**self._alpha
+
+    @classmethod
+    def from_floats(
+        cls,
+        s: float,
+        delta: float,
+        n: float,
+        g: float,
+        alpha: float,
+        k0: float = 1.0,
+    ) -> "SolowGrowthModel":
+        """Build a model from raw floats without Pydantic validation.
+
+        For trusted callers only (e.g. calibration or Monte Carlo loops
+        drawing from a valid parameter region); external input should go
+        through SolowParameters so the bounds are checked.
+
+        Args:
+            s: Savings rate
+            delta: Depreciation rate
+            n: Population growth rate
+            g: Technology growth rate
+            alpha: Capital share
+            k0: Initial capital per effective worker
+
+        Returns:
+            Model instance for the given parameters
+        """
+        params = SolowParameters.model_construct(
+            savings_rate=s,
+            depreciation_rate=delta,
+            population_growth=n,
+            tech_growth=g,
+            alpha=alpha,
+            initial_capital=k0,
+        )
+        return cls(params)
+
+    def production(self, capital: float | np.ndarray) -> float | np.ndarray:
         """Calculate output per effective worker.
 
+        Accepts a scalar or an array of capital values (e.g. a grid or a
+        trajectory), evaluated elementwise. Python scalars take the C
+        math.pow path and return a float; anything else goes through
+        np.power.
+
         Args:
             capital: Capital per effective worker (k)
 
         Returns:
             Output per effective worker: y = k^α
         """
-        return capital ** self.params.alpha
+        if isinstance(capital, (float, int)):
+            return math.pow(capital, self._alpha)
+        return np.power(capital, self._alpha)
 
-    def investment(self, capital: float) -> float:
+    def investment(self, capital: float | np.ndarray) -> float | np.ndarray:
         """Calculate investment per effective worker.
 
         Args:
@@ -80,7 +180,9 @@ class SolowGrowthModel:
         Returns:
             Investment: i = s·k^α
         """
-        return self.params.savings_rate * self.production(capital)
+        if isinstance(capital, (float, int)):
+            return self._s * math.pow(capital, self._alpha)
+        return self._s * np.power(capital, self._alpha)
 
     def effective_depreciation(self) -> float:
         """Calculate effective depreciation rate.
@@ -88,13 +190,9 @@ class SolowGrowthModel:
         Returns:
             Effective depreciation: (n + g + δ)
         """
-        return (
-            self.params.population_growth
-            + self.params.tech_growth
-            + self.params.depreciation_rate
-        )
+        return self._eff_dep
 
-    def capital_change(self, capital: float) -> float:
+    def capital_change(self, capital: float | np.ndarray) -> float | np.ndarray:
         """Calculate change in capital per effective worker.
 
         Args:
@@ -103,49 +201,107 @@ class SolowGrowthModel:
         Returns:
             Change in capital: dk/dt = s·k^α - (n + g + δ)·k
         """
-        return self.investment(capital) - self.effective_depreciation() * capital
+        if isinstance(capital, (float, int)):
+            return self._s * math.pow(capital, self._alpha) - self._eff_dep * capital
+        return self._s * np.power(capital, self._alpha) - self._eff_dep * capital
+
+    def simulate(self, T: int, dt: float = 1.0) -> np.ndarray:
+        """Simulate the capital path from the initial capital.
+
+        Uses explicit Euler steps, so dt = 1 gives the discrete-time Solow
+        model k(t+1) = k(t) + s·k(t)^α - (n + g + δ)·k(t).
+
+        Args:
+            T: Number of points in the trajectory (including k(0))
+            dt: Step size (default: 1.0)
+
+        Returns:
+            Array of length T with capital per effective worker
+        """
+        # The kernel writes k(0) unconditionally; Numba does no bounds checks
+        if T < 1:
+            raise ValueError(f"T must be at least 1, got {T}")
+        return solow_simulate(
+            float(self.params.initial_capital),
+            self._s,
+            self._alpha,
+            self._eff_dep,
+            int(T),
+            float(dt),
+        )
 
-    def calculate_steady_state(self) -> Dict[str, float]:
+    def calculate_steady_state(self) -> SteadyState:
         """Calculate steady-state values analytically.
 
         At steady state: s·k*^α = (n + g + δ)·k*
         Solving: k* = [s / (n + g + δ)]^(1/(1-α))
 
         Returns:
-            Dictionary with steady-state values:
-            - capital: k* (capital per effective worker)
-            - output: y* (output per effective worker)
-            - consumption: c* (consumption per effective worker)
-            - investment: i* (investment per effective worker)
-            - growth_rate: Steady-state growth rate of output per worker
+            SteadyState with capital, output, consumption, investment and
+            growth_rate
         """
-        s = self.params.savings_rate
-        n = self.params.population_growth
-        g = self.params.tech_growth
-        delta = self.params.depreciation_rate
-        alpha = self.params.alpha
+        s = self._s
+        y_star = self._y_star
+
+        return SteadyState(
+            self._k_star, y_star, (1 - s) * y_star, s * y_star, self.params.tech_growth
+        )
 
-        # Steady-state capital per effective worker
-        k_star = (s / (n + g + delta)) ** (1 / (1 - alpha))
+    @staticmethod
+    def steady_state_grid(s, n, g, delta, alpha) -> SteadyState:
+        """Calculate steady states for many parameter sets at once.
 
-        # Steady-state output per effective worker
-        y_star = k_star ** alpha
+        Arguments broadcast against each other, so e.g. an array of savings
+        rates can be combined with scalar n, g, δ and α.
 
-        # Steady-state investment per effective worker
-        i_star = s * y_star
+        Args:
+            s: Savings rate(s)
+            n: Population growth rate(s)
+            g: Technology growth rate(s)
+            delta: Depreciation rate(s)
+            alpha: Capital share(s)
 
-        # Steady-state consumption per effective worker
-        c_star = (1 - s) * y_star
+        Returns:
+            SteadyState whose fields are arrays over the parameter grid
+        """
+        s, n, g, delta, alpha = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (s, n, g, delta, alpha))
+        )
+        # One log shared by k* and y* = k*^α
+        log_k = np.log(s / (n + g + delta)) / (1.0 - alpha)
+        k_star = np.exp(log_k)
+        y_star = np.exp(alpha * log_k)
+        return SteadyState(k_star, y_star, (1 - s) * y_star, s * y_star, g)
 
-        return {
-            "capital": k_star,
-            "output": y_star,
-            "consumption": c_star,
-            "investment": i_star,
-            "growth_rate": g,  # Growth rate of output per worker in steady state
-        }
+    @staticmethod
+    def batch_steady_state(s, n, g, delta, alpha) -> SteadyState:
+        """Calculate steady states for large batches of parameter draws.
+
+        Same result as steady_state_grid, but evaluated by a compiled kernel
+        that splits the draws across cores when Numba is available; meant
+        for very large sweeps such as posterior samples.
+
+        Args:
+            s: Savings rate(s)
+            n: Population growth rate(s)
+            g: Technology growth rate(s)
+            delta: Depreciation rate(s)
+            alpha: Capital share(s)
 
-    def calculate_golden_rule(self) -> Dict[str, float]:
+        Returns:
+            SteadyState whose fields are arrays over the draws
+        """
+        s, n, g, delta, alpha = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (s, n, g, delta, alpha))
+        )
+        shape = s.shape
+        flat = [np.ascontiguousarray(x).ravel() for x in (s, n, g, delta, alpha)]
+        out = np.empty((4, flat[0].size))
+        solow_steady_state_batch(*flat, *out)
+        k_star, y_star, c_star, i_star = out.reshape((4,) + shape)
+        return SteadyState(k_star, y_star, c_star, i_star, g)
+
+    def calculate_golden_rule(self) -> GoldenRule:
         """Calculate Golden Rule steady state (maximizes consumption).
 
         Golden Rule: MPK = n + g + δ
@@ -153,35 +309,14 @@ class SolowGrowthModel:
         Solving: k_gold = [α / (n + g + δ)]^(1/(1-α))
 
         Returns:
-            Dictionary with Golden Rule values:
-            - capital: Golden Rule capital
-            - output: Golden Rule output
-            - consumption: Maximum steady-state consumption
-            - savings_rate: Required savings rate for Golden Rule
+            GoldenRule with capital, output, consumption and savings_rate
         """
-        n = self.params.population_growth
-        g = self.params.tech_growth
-        delta = self.params.depreciation_rate
-        alpha = self.params.alpha
-
-        # Golden Rule capital
-        k_gold = (alpha / (n + g + delta)) ** (1 / (1 - alpha))
-
-        # Golden Rule output
-        y_gold = k_gold ** alpha
-
-        # Required savings rate for Golden Rule
-        s_gold = alpha
-
-        # Golden Rule consumption (maximized)
-        c_gold = (1 - s_gold) * y_gold
+        # Required savings rate for Golden Rule is s = α
+        s_gold = self._alpha
 
-        return {
-            "capital": k_gold,
-            "output": y_gold,
-            "consumption": c_gold,
-            "savings_rate": s_gold,
-        }
+        return GoldenRule(
+            self._k_gold, self._y_gold, (1 - s_gold) * self._y_gold, s_gold
+        )
 
     def is_dynamically_efficient(self) -> bool:
         """Check if current savings rate is dynamically efficient.
@@ -193,3 +328,34 @@ class SolowGrowthModel:
             True if dynamically efficient, False if over-saving
         """
         return self.params.savings_rate <= self.params.alpha
+
+
+@lru_cache(maxsize=1024)
+def cached_model(
+    s: float, delta: float, n: float, g: float, alpha: float, k0: float = 1.0
+) -> SolowGrowthModel:
+    """Validated model for these parameter values, reused across calls.
+
+    Models are read-only after construction, so callers repeating the same
+    calibration share one instance and its precomputed steady state.
+
+    Args:
+        s: Savings rate
+        delta: Depreciation rate
+        n: Population growth rate
+        g: Technology growth rate
+        alpha: Capital share
+        k0: Initial capital per effective worker
+
+    Returns:
+        Model instance for the given parameters
+    """
+    params = SolowParameters(
+        savings_rate=s,
+        depreciation_rate=delta,
+        population_growth=n,
+        tech_growth=g,
+        alpha=alpha,
+        initial_capital=k0,
+    )
+    return SolowGrowthModel(params)
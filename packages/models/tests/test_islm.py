@@ -8,6 +8,30 @@ import numpy as np
 from packages.models.src.macroeconomic.islm import ISLMModel, ISLMParameters
 
 
+@pytest.fixture(scope="module")
+def standard_params():
+    """Standard calibration for testing."""
+    return ISLMParameters(
+        autonomous_consumption=100,
+        mpc=0.8,
+        autonomous_investment=200,
+        investment_sensitivity=50,
+        autonomous_money_demand=50,
+        income_money_demand=0.2,
+        interest_money_demand=100,
+        government_spending=250,
+        taxes=200,
+        money_supply=1000,
+        price_level=1.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def model(standard_params):
+    """Create model instance."""
+    return ISLMModel(standard_params)
+
+
 class TestISLMParameters:
     """Test parameter validation."""
 
@@ -96,28 +120,6 @@ class TestISLMParameters:
 class TestISLMModel:
     """Test IS-LM model calculations."""
 
-    @pytest.fixture
-    def standard_params(self):
-        """Standard calibration for testing."""
-        return ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=250,
-            taxes=200,
-            money_supply=1000,
-            price_level=1.0,
-        )
-
-    @pytest.fixture
-    def model(self, standard_params):
-        """Create model instance."""
-        return ISLMModel(standard_params)
-
     def test_consumption_function(self, model):
         """Test consumption: C = c0 + c1(Y - T)."""
         income = 1000
@@ -183,6 +185,19 @@ class TestISLMModel:
         # Aggregate demand should equal income
         assert np.isclose(eq["aggregate_demand"], eq["income"], rtol=1e-6)
 
+    def test_batch_equilibrium_matches_scalar(self, model):
+        """Test batch equilibria match one-at-a-time solves."""
+        G = np.array([200.0, 250.0, 300.0])
+        batch = model.batch_equilibrium(G, model.params.taxes, model.params.money_supply)
+
+        for j, g in enumerate(G):
+            params = model.params.model_copy(update={"government_spending": g})
+            eq = ISLMModel(params).calculate_equilibrium()
+            assert np.isclose(batch["income"][j], eq["income"])
+            assert np.isclose(batch["interest_rate"][j], eq["interest_rate"])
+            assert np.isclose(batch["consumption"][j], eq["consumption"])
+            assert np.isclose(batch["investment"][j], eq["investment"])
+
     def test_fiscal_multiplier(self, model):
         """Test fiscal multiplier is 1/(1-c1)."""
         eq = model.calculate_equilibrium()
@@ -291,32 +306,10 @@ class TestISLMModel:
         if eq["interest_rate"] < 0.001:
             assert model_trap.is_liquidity_trap()
 
-    def test_comparative_statics_government_spending(self):
+    def test_comparative_statics_government_spending(self, standard_params):
         """Higher government spending should increase equilibrium output."""
-        params_low = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=200,  # Lower G
-            taxes=200,
-            money_supply=1000,
-        )
-        params_high = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=300,  # Higher G
-            taxes=200,
-            money_supply=1000,
-        )
+        params_low = standard_params.model_copy(update={"government_spending": 200})
+        params_high = standard_params.model_copy(update={"government_spending": 300})
 
         model_low = ISLMModel(params_low)
         model_high = ISLMModel(params_high)
@@ -327,32 +320,10 @@ class TestISLMModel:
         assert eq_high["income"] > eq_low["income"]
         assert eq_high["interest_rate"] > eq_low["interest_rate"]
 
-    def test_comparative_statics_money_supply(self):
+    def test_comparative_statics_money_supply(self, standard_params):
         """Higher money supply should increase output and lower interest rate."""
-        params_low = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=250,
-            taxes=200,
-            money_supply=800,  # Lower M
-        )
-        params_high = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=250,
-            taxes=200,
-            money_supply=1200,  # Higher M
-        )
+        params_low = standard_params.model_copy(update={"money_supply": 800})
+        params_high = standard_params.model_copy(update={"money_supply": 1200})
 
         model_low = ISLMModel(params_low)
         model_high = ISLMModel(params_high)
@@ -363,34 +334,10 @@ class TestISLMModel:
         assert eq_high["income"] > eq_low["income"]
         assert eq_high["interest_rate"] < eq_low["interest_rate"]
 
-    def test_price_level_effects(self):
+    def test_price_level_effects(self, standard_params):
         """Higher price level should reduce real money supply and output."""
-        params_low_p = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=250,
-            taxes=200,
-            money_supply=1000,
-            price_level=1.0,  # Lower P
-        )
-        params_high_p = ISLMParameters(
-            autonomous_consumption=100,
-            mpc=0.8,
-            autonomous_investment=200,
-            investment_sensitivity=50,
-            autonomous_money_demand=50,
-            income_money_demand=0.2,
-            interest_money_demand=100,
-            government_spending=250,
-            taxes=200,
-            money_supply=1000,
-            price_level=2.0,  # Higher P
-        )
+        params_low_p = standard_params  # P = 1
+        params_high_p = standard_params.model_copy(update={"price_level": 2.0})
 
         model_low_p = ISLMModel(params_low_p)
         model_high_p = ISLMModel(params_high_p)
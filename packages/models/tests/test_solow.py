@@ -5,7 +5,30 @@ Tests compare numerical results against analytical solutions from economic theor
 
 import pytest
 import numpy as np
-from packages.models.src.macroeconomic.solow import SolowGrowthModel, SolowParameters
+from packages.models.src.macroeconomic.solow import (
+    SolowGrowthModel,
+    SolowParameters,
+    cached_model,
+)
+
+
+@pytest.fixture(scope="module")
+def standard_params():
+    """Standard calibration for testing."""
+    return SolowParameters(
+        savings_rate=0.2,
+        depreciation_rate=0.05,
+        population_growth=0.01,
+        tech_growth=0.02,
+        alpha=0.33,
+        initial_capital=1.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def model(standard_params):
+    """Create model instance."""
+    return SolowGrowthModel(standard_params)
 
 
 class TestSolowParameters:
@@ -63,23 +86,6 @@ class TestSolowParameters:
 class TestSolowModel:
     """Test Solow model calculations."""
 
-    @pytest.fixture
-    def standard_params(self):
-        """Standard calibration for testing."""
-        return SolowParameters(
-            savings_rate=0.2,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
-
-    @pytest.fixture
-    def model(self, standard_params):
-        """Create model instance."""
-        return SolowGrowthModel(standard_params)
-
     def test_production_function(self, model):
         """Test Cobb-Douglas production: y = k^α."""
         k = 4.0
@@ -92,6 +98,14 @@ class TestSolowModel:
         expected = 0.2 * (4.0 ** 0.33)
         assert np.isclose(model.investment(k), expected)
 
+    def test_vectorized_capital_grid(self, model):
+        """Production, investment and capital change broadcast over arrays."""
+        k = np.linspace(0.1, 10, 1000)
+
+        assert np.allclose(model.production(k), k ** 0.33)
+        assert np.allclose(model.investment(k), 0.2 * k ** 0.33)
+        assert np.allclose(model.capital_change(k), 0.2 * k ** 0.33 - 0.08 * k)
+
     def test_effective_depreciation(self, model):
         """Test effective depreciation: n + g + δ."""
         expected = 0.01 + 0.02 + 0.05  # = 0.08
@@ -111,93 +125,63 @@ class TestSolowModel:
         c_star_expected = (1 - s) * y_star_expected
         i_star_expected = s * y_star_expected
 
-        assert np.isclose(ss["capital"], k_star_expected, rtol=1e-6)
-        assert np.isclose(ss["output"], y_star_expected, rtol=1e-6)
-        assert np.isclose(ss["consumption"], c_star_expected, rtol=1e-6)
-        assert np.isclose(ss["investment"], i_star_expected, rtol=1e-6)
-        assert np.isclose(ss["growth_rate"], 0.02)  # = g
+        assert np.isclose(ss.capital, k_star_expected, rtol=1e-6)
+        assert np.isclose(ss.output, y_star_expected, rtol=1e-6)
+        assert np.isclose(ss.consumption, c_star_expected, rtol=1e-6)
+        assert np.isclose(ss.investment, i_star_expected, rtol=1e-6)
+        assert np.isclose(ss.growth_rate, 0.02)  # = g
 
     def test_steady_state_zero_change(self, model):
         """At steady state, capital change should be zero."""
         ss = model.calculate_steady_state()
-        k_star = ss["capital"]
+        k_star = ss.capital
 
         # At steady state: dk/dt = 0
         dk = model.capital_change(k_star)
         assert np.isclose(dk, 0.0, atol=1e-10)
 
-    def test_golden_rule(self):
+    def test_golden_rule(self, standard_params):
         """Test Golden Rule calculation.
 
         Golden Rule: s = α maximizes steady-state consumption.
         """
-        params = SolowParameters(
-            savings_rate=0.33,  # = α
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
+        params = standard_params.model_copy(update={"savings_rate": 0.33})  # = α
         model = SolowGrowthModel(params)
 
         ss = model.calculate_steady_state()
         golden = model.calculate_golden_rule()
 
         # When s = α, steady state should equal Golden Rule
-        assert np.isclose(ss["capital"], golden["capital"], rtol=1e-6)
-        assert np.isclose(ss["consumption"], golden["consumption"], rtol=1e-6)
+        assert np.isclose(ss.capital, golden.capital, rtol=1e-6)
+        assert np.isclose(ss.consumption, golden.consumption, rtol=1e-6)
 
-    def test_golden_rule_maximizes_consumption(self):
+    def test_golden_rule_maximizes_consumption(self, model):
         """Golden Rule should give higher consumption than arbitrary s."""
-        # Model with s < α
-        params_low = SolowParameters(
-            savings_rate=0.2,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
-        model_low = SolowGrowthModel(params_low)
+        # Standard calibration has s < α
+        model_low = model
 
         # Golden Rule consumption
         golden = model_low.calculate_golden_rule()
         ss_low = model_low.calculate_steady_state()
 
         # Golden Rule should have higher consumption
-        assert golden["consumption"] > ss_low["consumption"]
+        assert golden.consumption > ss_low.consumption
 
-    def test_dynamic_efficiency(self):
+    def test_dynamic_efficiency(self, standard_params):
         """Test dynamic efficiency check."""
         # Efficient: s < α
-        params_efficient = SolowParameters(
-            savings_rate=0.2,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
-        model_efficient = SolowGrowthModel(params_efficient)
+        model_efficient = SolowGrowthModel(standard_params)
         assert model_efficient.is_dynamically_efficient()
 
         # Inefficient: s > α
-        params_inefficient = SolowParameters(
-            savings_rate=0.5,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
+        params_inefficient = standard_params.model_copy(update={"savings_rate": 0.5})
         model_inefficient = SolowGrowthModel(params_inefficient)
         assert not model_inefficient.is_dynamically_efficient()
 
     def test_capital_accumulation_below_steady_state(self, model):
         """Below steady state, capital should increase (dk/dt > 0)."""
         ss = model.calculate_steady_state()
-        k_below = ss["capital"] * 0.5
+        k_below = ss.capital * 0.5
 
         dk = model.capital_change(k_below)
         assert dk > 0, "Capital should accumulate below steady state"
@@ -205,29 +189,70 @@ class TestSolowModel:
     def test_capital_accumulation_above_steady_state(self, model):
         """Above steady state, capital should decrease (dk/dt < 0)."""
         ss = model.calculate_steady_state()
-        k_above = ss["capital"] * 1.5
+        k_above = ss.capital * 1.5
 
         dk = model.capital_change(k_above)
         assert dk < 0, "Capital should depreciate above steady state"
 
-    def test_comparative_statics_savings_rate(self):
+    def test_simulate_trajectory(self, model):
+        """Simulated path takes Euler steps and converges to steady state."""
+        path = model.simulate(T=2000)
+
+        assert path.shape == (2000,)
+        assert path[0] == 1.0
+        assert np.isclose(path[1], 1.0 + model.capital_change(1.0))
+        assert np.all(np.diff(path) >= 0)  # Monotone from below
+        assert np.isclose(path[-1], model.calculate_steady_state().capital, rtol=1e-6)
+
+    def test_simulate_rejects_empty_path(self, model):
+        """A trajectory needs at least the initial point."""
+        with pytest.raises(ValueError):
+            model.simulate(T=0)
+
+    def test_from_floats(self, model):
+        """Unvalidated construction matches the validated model."""
+        fast = SolowGrowthModel.from_floats(0.2, 0.05, 0.01, 0.02, 0.33, 1.0)
+
+        assert fast.params == model.params
+        assert fast.calculate_steady_state() == model.calculate_steady_state()
+
+    def test_cached_model(self, model):
+        """Repeated calibrations share one validated model."""
+        cached = cached_model(0.2, 0.05, 0.01, 0.02, 0.33)
+
+        assert cached is cached_model(0.2, 0.05, 0.01, 0.02, 0.33)
+        assert cached.params == model.params
+
+    def test_steady_state_grid(self, standard_params):
+        """Vectorized steady states match one model per parameter set."""
+        savings = np.linspace(0.1, 0.5, 5)
+        grid = SolowGrowthModel.steady_state_grid(savings, 0.01, 0.02, 0.05, 0.33)
+
+        for j, s in enumerate(savings):
+            params = standard_params.model_copy(update={"savings_rate": s})
+            ss = SolowGrowthModel(params).calculate_steady_state()
+            assert np.isclose(grid.capital[j], ss.capital)
+            assert np.isclose(grid.output[j], ss.output)
+            assert np.isclose(grid.consumption[j], ss.consumption)
+            assert np.isclose(grid.investment[j], ss.investment)
+            assert np.isclose(grid.growth_rate[j], ss.growth_rate)
+
+    def test_batch_steady_state_matches_grid(self):
+        """Compiled batch agrees with the vectorized grid."""
+        rng = np.random.default_rng(0)
+        s = rng.uniform(0.1, 0.5, 1000)
+        alpha = rng.uniform(0.2, 0.5, 1000)
+
+        batch = SolowGrowthModel.batch_steady_state(s, 0.01, 0.02, 0.05, alpha)
+        grid = SolowGrowthModel.steady_state_grid(s, 0.01, 0.02, 0.05, alpha)
+
+        for field in ("capital", "output", "consumption", "investment"):
+            assert np.allclose(getattr(batch, field), getattr(grid, field))
+
+    def test_comparative_statics_savings_rate(self, standard_params):
         """Higher savings rate should increase steady-state capital."""
-        params_low = SolowParameters(
-            savings_rate=0.2,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
-        params_high = SolowParameters(
-            savings_rate=0.3,
-            depreciation_rate=0.05,
-            population_growth=0.01,
-            tech_growth=0.02,
-            alpha=0.33,
-            initial_capital=1.0,
-        )
+        params_low = standard_params  # s = 0.2
+        params_high = standard_params.model_copy(update={"savings_rate": 0.3})
 
         model_low = SolowGrowthModel(params_low)
         model_high = SolowGrowthModel(params_high)
@@ -235,5 +260,5 @@ class TestSolowModel:
         ss_low = model_low.calculate_steady_state()
         ss_high = model_high.calculate_steady_state()
 
-        assert ss_high["capital"] > ss_low["capital"]
-        assert ss_high["output"] > ss_low["output"]
+        assert ss_high.capital > ss_low.capital
+        assert ss_high.output > ss_low.output
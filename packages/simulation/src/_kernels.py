@@ -0,0 +1,125 @@
+"""
+Compiled numerical kernels for the simulation engine.
+
+Kernels operate on plain floats and preallocated arrays so they can be
+compiled with Numba (see packages.models.src._jit).
+"""
+
+import math
+
+from packages.models.src._jit import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def solow_rhs(k, t, s, n, g, delta, alpha):
+    """Solow capital dynamics dk/dt = s·k^α - (n + g + δ)·k.
+
+    Takes (k, t, *params) like scipy.integrate.odeint's func, so the
+    compiled function can also be handed to an external solver.
+
+    Args:
+        k: Capital per effective worker (k > 0)
+        t: Time (unused; the system is autonomous)
+        s: Savings rate
+        n: Population growth rate
+        g: Technology growth rate
+        delta: Depreciation rate
+        alpha: Capital share
+
+    Returns:
+        Time derivative of capital
+    """
+    # k^α as exp(α·log k); capital stays positive along the path
+    return s * math.exp(alpha * math.log(k)) - (n + g + delta) * k
+
+
+@njit(cache=True, fastmath=True)
+def solow_jac(k, t, s, n, g, delta, alpha):
+    """Derivative of the Solow right-hand side with respect to capital.
+
+    d(dk/dt)/dk = s·α·k^(α-1) - (n + g + δ), the 1×1 Jacobian of the
+    system; same signature as solow_rhs so implicit solvers can use it
+    instead of finite differences.
+
+    Args:
+        k: Capital per effective worker (k > 0)
+        t: Time (unused; the system is autonomous)
+        s: Savings rate
+        n: Population growth rate
+        g: Technology growth rate
+        delta: Depreciation rate
+        alpha: Capital share
+
+    Returns:
+        Partial derivative of dk/dt with respect to k
+    """
+    return s * alpha * math.exp((alpha - 1.0) * math.log(k)) - (n + g + delta)
+
+
+@njit(cache=True, fastmath=True)
+def solow_path(k0, s, alpha, delta, n, g, dt, N, out_k, out_y, out_c, out_i):
+    """Integrate Solow capital dynamics and fill the output series.
+
+    Steps dk/dt = s·k^α - (n + g + δ)·k with classical fixed-step RK4 and
+    computes output, consumption and investment in the same pass.
+
+    Args:
+        k0: Initial capital per effective worker
+        s: Savings rate
+        alpha: Capital share
+        delta: Depreciation rate
+        n: Population growth rate
+        g: Technology growth rate
+        dt: Time step
+        N: Number of grid points (including t=0)
+        out_k: Output array for capital, length >= N
+        out_y: Output array for output, length >= N
+        out_c: Output array for consumption, length >= N
+        out_i: Output array for investment, length >= N
+    """
+    eff_dep = n + g + delta
+    half_dt = 0.5 * dt
+    k = k0
+    for j in range(N):
+        # k^α as exp(α·log k); capital stays positive along the path
+        y = math.exp(alpha * math.log(k))
+        out_k[j] = k
+        out_y[j] = y
+        out_c[j] = (1.0 - s) * y
+        out_i[j] = s * y
+
+        # First stage reuses y = k^α from above
+        k1 = s * y - eff_dep * k
+        k2 = solow_rhs(k + half_dt * k1, 0.0, s, n, g, delta, alpha)
+        k3 = solow_rhs(k + half_dt * k2, 0.0, s, n, g, delta, alpha)
+        k4 = solow_rhs(k + dt * k3, 0.0, s, n, g, delta, alpha)
+        k = k + dt * (k1 + 2.0 * k2 + 2.0 * k3 + k4) / 6.0
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def solow_path_batch(k0, s, alpha, delta, n, g, dt, out_k, out_y, out_c, out_i):
+    """Integrate one Solow path per parameter set, in parallel.
+
+    Each row b of the outputs is filled by solow_path with the b-th
+    initial capital and parameter values; rows are independent, so they
+    are split across cores when Numba is available.
+
+    Args:
+        k0: Initial capital per effective worker, shape (B,)
+        s: Savings rates, shape (B,)
+        alpha: Capital shares, shape (B,)
+        delta: Depreciation rates, shape (B,)
+        n: Population growth rates, shape (B,)
+        g: Technology growth rates, shape (B,)
+        dt: Time step
+        out_k: Output array for capital, shape (B, N)
+        out_y: Output array for output, shape (B, N)
+        out_c: Output array for consumption, shape (B, N)
+        out_i: Output array for investment, shape (B, N)
+    """
+    N = out_k.shape[1]
+    for b in prange(out_k.shape[0]):
+        solow_path(
+            k0[b], s[b], alpha[b], delta[b], n[b], g[b], dt, N,
+            out_k[b], out_y[b], out_c[b], out_i[b],
+        )
@@ -5,15 +5,40 @@ Provides time-path simulation capabilities for dynamic economic models.
 """
 
 import numpy as np
-from scipy.integrate import odeint
-from typing import Callable, Dict, List, Optional, Any
+import orjson
+from typing import Dict, Literal, Optional, Any, Sequence
 from dataclasses import dataclass
+from numpy.typing import DTypeLike
 
+from packages.simulation.src._kernels import (
+    solow_jac,
+    solow_path,
+    solow_path_batch,
+    solow_rhs,
+)
+from packages.simulation.src.serialization import json_default
 
-@dataclass
+
+def _time_grid(horizon: float, time_step: float) -> tuple[np.ndarray, float]:
+    """Time grid from 0 to horizon with a whole number of steps.
+
+    Rounds horizon / time_step to an integer step count, so the grid ends
+    exactly at horizon and its length is known before allocating paths.
+
+    Returns:
+        Tuple of (grid, step actually used between grid points)
+    """
+    n_steps = max(int(round(horizon / time_step)), 1)
+    return np.linspace(0.0, horizon, n_steps + 1), horizon / n_steps
+
+
+@dataclass(slots=True, frozen=True)
 class SimulationResult:
     """Results from a model simulation.
 
+    Slotted and frozen: results are built once by the engine and shipped
+    between processes, so they carry no per-instance __dict__.
+
     Attributes:
         time: Array of time points
         states: Dictionary mapping state variable names to their time paths
@@ -25,13 +50,28 @@ class SimulationResult:
     metadata: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary for serialization."""
+        """Convert result to dictionary for serialization.
+
+        Builds a Python float per sample; prefer to_json for long paths.
+        """
         return {
             "time": self.time.tolist(),
             "states": {k: v.tolist() for k, v in self.states.items()},
             "metadata": self.metadata,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize result to JSON bytes.
+
+        Same layout as to_dict, but orjson reads the arrays straight from
+        their buffers instead of converting them to lists first.
+        """
+        return orjson.dumps(
+            {"time": self.time, "states": self.states, "metadata": self.metadata},
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
 
 class SimulationEngine:
     """Engine for simulating dynamic economic models.
@@ -52,37 +92,56 @@ class SimulationEngine:
         horizon: int,
         time_step: float = 0.1,
         initial_capital: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
+        solver: Literal["rk4", "odeint"] = "rk4",
     ) -> SimulationResult:
         """Simulate Solow model transition dynamics.
 
         Args:
             horizon: Number of time periods to simulate
-            time_step: Time step for simulation (default: 0.1)
+            time_step: Time step for simulation (default: 0.1); adjusted so a
+                whole number of steps spans the horizon, and the step actually
+                used is reported as metadata["time_step"]
             initial_capital: Starting capital (uses model param if None)
+            dtype: Dtype of the returned state paths; integration always runs
+                in float64 (pass np.float32 for plotting/transport)
+            solver: "rk4" (default) steps a compiled fixed-step RK4 kernel;
+                "odeint" integrates with scipy's adaptive LSODA and the
+                analytic Jacobian, e.g. to validate the RK4 path
 
         Returns:
             SimulationResult with time paths of capital, output, consumption
         """
         # Set initial capital
         k0 = initial_capital if initial_capital is not None else self.model.params.initial_capital
+        if not k0 > 0:
+            raise ValueError(f"Initial capital must be positive, got {k0}")
 
         # Create time grid
-        t = np.arange(0, horizon + time_step, time_step)
-
-        # Define ODE function
-        def dk_dt(k: float, t: float) -> float:
-            """Capital accumulation differential equation."""
-            return self.model.capital_change(k)
-
-        # Solve ODE
-        k_path = odeint(dk_dt, k0, t).flatten()
-
-        # Calculate other variables
-        y_path = np.array([self.model.production(k) for k in k_path])
-        c_path = np.array(
-            [(1 - self.model.params.savings_rate) * y for y in y_path]
-        )
-        i_path = np.array([self.model.investment(k) for k in k_path])
+        t, dt = _time_grid(horizon, time_step)
+        n = len(t)
+
+        # One contiguous block backs all four series; rows are returned as views
+        params = self.model.params
+        paths = np.empty((4, n))
+        if solver == "rk4":
+            # Integrate capital and compute derived paths in one compiled pass
+            solow_path(
+                float(k0),
+                params.savings_rate,
+                params.alpha,
+                params.depreciation_rate,
+                params.population_growth,
+                params.tech_growth,
+                dt,
+                n,
+                *paths,
+            )
+        elif solver == "odeint":
+            self._solow_odeint(float(k0), t, paths)
+        else:
+            raise ValueError(f"Unknown solver {solver!r}; expected 'rk4' or 'odeint'")
+        k_path, y_path, c_path, i_path = paths.astype(dtype, copy=False)
 
         # Calculate steady state for reference
         ss = self.model.calculate_steady_state()
@@ -97,19 +156,45 @@ class SimulationEngine:
             },
             metadata={
                 "horizon": horizon,
-                "time_step": time_step,
+                "time_step": dt,
                 "initial_capital": k0,
-                "steady_state": ss,
+                "steady_state": ss._asdict(),
                 "model_params": self.model.params.model_dump(),
             },
         )
 
+    def _solow_odeint(self, k0: float, t: np.ndarray, paths: np.ndarray) -> None:
+        """Fill Solow paths on grid t using scipy's LSODA integrator.
+
+        Shares the compiled right-hand side and Jacobian with the kernels;
+        odeint works on length-1 state vectors, so both are wrapped.
+        """
+        from scipy.integrate import odeint
+
+        params = self.model.params
+        s = params.savings_rate
+        alpha = params.alpha
+        args = (s, params.population_growth, params.tech_growth, params.depreciation_rate, alpha)
+
+        k_path, y_path, c_path, i_path = paths
+        k_path[:] = odeint(
+            lambda k, t, *a: solow_rhs(k[0], t, *a),
+            [k0],
+            t,
+            args=args,
+            Dfun=lambda k, t, *a: [[solow_jac(k[0], t, *a)]],
+        )[:, 0]
+        np.power(k_path, alpha, out=y_path)
+        np.multiply(1.0 - s, y_path, out=c_path)
+        np.multiply(s, y_path, out=i_path)
+
     def impulse_response(
         self,
         shock_var: str,
         shock_size: float,
         horizon: int,
         time_step: float = 0.1,
+        dtype: DTypeLike = np.float64,
     ) -> SimulationResult:
         """Calculate impulse response to a parameter shock.
 
@@ -118,45 +203,47 @@ class SimulationEngine:
             shock_size: Size of shock (additive)
             horizon: Number of periods to simulate
             time_step: Time step for simulation
+            dtype: Dtype of the returned state paths
 
         Returns:
             SimulationResult showing response to shock
         """
         # Start from steady state
         ss = self.model.calculate_steady_state()
-        k0 = ss["capital"]
+        k0 = ss.capital
 
         # Create shocked parameters
-        shocked_params = self.model.params.model_copy(deep=True)
-        current_value = getattr(shocked_params, shock_var)
-        new_value = current_value + shock_size
-
-        # Create new shocked parameters (Pydantic v2 style)
-        shocked_params_dict = shocked_params.model_dump()
+        shocked_params_dict = self.model.params.model_dump()
+        if shock_var not in shocked_params_dict:
+            raise ValueError(f"Unknown shock variable {shock_var!r}")
+        new_value = shocked_params_dict[shock_var] + shock_size
         shocked_params_dict[shock_var] = new_value
 
-        # Import the model class to create new instance
-        from packages.models.src.macroeconomic.solow import (
-            SolowGrowthModel,
-            SolowParameters,
-        )
+        # Import the model factory to create (or reuse) the shocked model
+        from packages.models.src.macroeconomic.solow import cached_model
 
-        # Validate shocked parameter will be accepted by Pydantic model
+        # Validated on first use; repeated shocks share one model instance
         try:
-            new_params = SolowParameters(**shocked_params_dict)
+            shocked_model = cached_model(
+                shocked_params_dict["savings_rate"],
+                shocked_params_dict["depreciation_rate"],
+                shocked_params_dict["population_growth"],
+                shocked_params_dict["tech_growth"],
+                shocked_params_dict["alpha"],
+                shocked_params_dict["initial_capital"],
+            )
         except ValueError as e:
             raise ValueError(
                 f"Shock of {shock_size} to {shock_var} results in invalid value "
                 f"{new_value}. Parameter constraints violated: {str(e)}"
             )
-        shocked_model = SolowGrowthModel(new_params)
 
         # Create temporary engine with shocked model
         shocked_engine = SimulationEngine(shocked_model)
 
         # Simulate from old steady state with new parameters
         result = shocked_engine.simulate_solow(
-            horizon=horizon, time_step=time_step, initial_capital=k0
+            horizon=horizon, time_step=time_step, initial_capital=k0, dtype=dtype
         )
 
         # Add shock metadata
@@ -164,26 +251,185 @@ class SimulationEngine:
             {
                 "shock_var": shock_var,
                 "shock_size": shock_size,
-                "initial_steady_state": ss,
+                "initial_steady_state": ss._asdict(),
             }
         )
 
         return result
 
+    def impulse_response_batch(
+        self,
+        shock_var: str,
+        shock_sizes: Sequence[float],
+        horizon: int,
+        time_step: float = 0.1,
+    ) -> SimulationResult:
+        """Calculate impulse responses for many sizes of one parameter shock.
+
+        Every path starts from the current steady state, as in
+        impulse_response; paths are integrated together by one compiled
+        kernel rather than one call per shock.
+
+        Args:
+            shock_var: Parameter to shock (e.g., 'savings_rate')
+            shock_sizes: Sizes of the shocks (additive), shape (B,)
+            horizon: Number of periods to simulate
+            time_step: Time step for simulation
+
+        Returns:
+            SimulationResult whose states have shape (B, len(time)), one row
+            per shock size
+        """
+        from packages.models.src.macroeconomic.solow import (
+            SolowGrowthModel,
+            SolowParameters,
+        )
+
+        sizes = np.asarray(shock_sizes, dtype=np.float64)
+        ss = self.model.calculate_steady_state()
+        base = self.model.params.model_dump()
+        if shock_var not in base:
+            raise ValueError(f"Unknown shock variable {shock_var!r}")
+
+        # Parameter bounds are intervals, so validating the two extreme
+        # shocks validates every shock in between
+        if sizes.size:
+            for size in (sizes.min(), sizes.max()):
+                new_value = base[shock_var] + size
+                try:
+                    SolowParameters(**{**base, shock_var: new_value})
+                except ValueError as e:
+                    raise ValueError(
+                        f"Shock of {size} to {shock_var} results in invalid value "
+                        f"{new_value}. Parameter constraints violated: {str(e)}"
+                    )
+
+        # One array per parameter, varying only in the shocked one
+        values = {name: np.full(sizes.size, value) for name, value in base.items()}
+        values[shock_var] = base[shock_var] + sizes
+        s = values["savings_rate"]
+        alpha = values["alpha"]
+        delta = values["depreciation_rate"]
+        n_pop = values["population_growth"]
+        g = values["tech_growth"]
+
+        t, dt = _time_grid(horizon, time_step)
+        paths = np.empty((4, sizes.size, len(t)))
+        k_path, y_path, c_path, i_path = paths
+        solow_path_batch(
+            np.full(sizes.size, ss.capital), s, alpha, delta, n_pop, g, dt,
+            k_path, y_path, c_path, i_path,
+        )
+
+        # Shocked steady states, evaluated together
+        shocked_ss = SolowGrowthModel.steady_state_grid(s, n_pop, g, delta, alpha)
+
+        return SimulationResult(
+            time=t,
+            states={
+                "capital": k_path,
+                "output": y_path,
+                "consumption": c_path,
+                "investment": i_path,
+            },
+            metadata={
+                "horizon": horizon,
+                "time_step": dt,
+                "initial_capital": ss.capital,
+                "shock_var": shock_var,
+                "shock_sizes": sizes.tolist(),
+                "initial_steady_state": ss._asdict(),
+                "steady_state": {
+                    name: value.tolist() for name, value in shocked_ss._asdict().items()
+                },
+                "model_params": self.model.params.model_dump(),
+            },
+        )
+
+    @staticmethod
+    def simulate_solow_many(
+        params: Sequence[Any],
+        horizon: int,
+        time_step: float = 0.1,
+    ) -> SimulationResult:
+        """Simulate independent Solow transitions for many parameter sets.
+
+        Each run starts from its own initial capital; runs are integrated
+        by one compiled kernel that splits them across cores when Numba is
+        available, e.g. for Monte Carlo draws or calibration sweeps.
+
+        Args:
+            params: SolowParameters, one per run (R runs)
+            horizon: Number of time periods to simulate
+            time_step: Time step for simulation
+
+        Returns:
+            SimulationResult whose states have shape (R, len(time)), one row
+            per run
+        """
+        from packages.models.src.macroeconomic.solow import SolowGrowthModel
+
+        k0, s, alpha, delta, n_pop, g = (
+            np.array([getattr(p, name) for p in params], dtype=np.float64)
+            for name in (
+                "initial_capital",
+                "savings_rate",
+                "alpha",
+                "depreciation_rate",
+                "population_growth",
+                "tech_growth",
+            )
+        )
+
+        t, dt = _time_grid(horizon, time_step)
+        paths = np.empty((4, k0.size, len(t)))
+        k_path, y_path, c_path, i_path = paths
+        solow_path_batch(
+            k0, s, alpha, delta, n_pop, g, dt,
+            k_path, y_path, c_path, i_path,
+        )
+
+        steady = SolowGrowthModel.steady_state_grid(s, n_pop, g, delta, alpha)
+
+        return SimulationResult(
+            time=t,
+            states={
+                "capital": k_path,
+                "output": y_path,
+                "consumption": c_path,
+                "investment": i_path,
+            },
+            metadata={
+                "horizon": horizon,
+                "time_step": dt,
+                "initial_capital": k0.tolist(),
+                "steady_state": {
+                    name: value.tolist() for name, value in steady._asdict().items()
+                },
+                "model_params": [p.model_dump() for p in params],
+            },
+        )
+
     def simulate_islm(
         self,
         horizon: int,
-        shock_times: Optional[List[int]] = None,
-        shock_types: Optional[List[str]] = None,
-        shock_sizes: Optional[List[float]] = None,
+        shock_times: Optional[Sequence[int]] = None,
+        shock_types: Optional[Sequence[str]] = None,
+        shock_sizes: Optional[Sequence[float]] = None,
+        dtype: DTypeLike = np.float64,
     ) -> SimulationResult:
         """Simulate IS-LM model with optional policy shocks.
 
+        Shock specifications may be lists or aligned NumPy arrays; arrays of
+        the expected dtype are used without copying.
+
         Args:
             horizon: Number of periods to simulate
             shock_times: Time periods when shocks occur
             shock_types: Types of shocks ('G', 'T', 'M')
             shock_sizes: Size of each shock
+            dtype: Dtype of the returned state paths; equilibria are always
+                solved in float64
 
         Returns:
             SimulationResult with time paths of income, interest rate, etc.
@@ -192,24 +438,6 @@ class SimulationEngine:
         time = np.arange(0, horizon + 1)
         n = len(time)
 
-        # Arrays to store results
-        income = np.zeros(n)
-        interest_rate = np.zeros(n)
-        consumption = np.zeros(n)
-        investment = np.zeros(n)
-
-        # Initialize at equilibrium
-        eq = self.model.calculate_equilibrium()
-        income[0] = eq["income"]
-        interest_rate[0] = eq["interest_rate"]
-        consumption[0] = eq["consumption"]
-        investment[0] = eq["investment"]
-
-        # Store current parameters
-        current_G = self.model.params.government_spending
-        current_T = self.model.params.taxes
-        current_M = self.model.params.money_supply
-
         # Process shocks
         if shock_times is None:
             shock_times = []
@@ -217,72 +445,74 @@ class SimulationEngine:
             shock_types = []
         if shock_sizes is None:
             shock_sizes = []
+        if not len(shock_times) == len(shock_types) == len(shock_sizes):
+            raise ValueError(
+                "shock_times, shock_types and shock_sizes must have the same length"
+            )
 
-        # Import IS-LM model classes
-        from packages.models.src.macroeconomic.islm import ISLMModel, ISLMParameters
-
-        # Simulate period by period
-        current_model = self.model
-        for t in range(1, n):
-            # Check for shocks at this time
-            for shock_idx, shock_time in enumerate(shock_times):
-                if t == shock_time:
-                    shock_type = shock_types[shock_idx]
-                    shock_size = shock_sizes[shock_idx]
-
-                    if shock_type == "G":
-                        current_G += shock_size
-                    elif shock_type == "T":
-                        current_T += shock_size
-                    elif shock_type == "M":
-                        current_M += shock_size
-
-                    # Create new model with updated parameters
-                    new_params = ISLMParameters(
-                        autonomous_consumption=self.model.params.autonomous_consumption,
-                        mpc=self.model.params.mpc,
-                        autonomous_investment=self.model.params.autonomous_investment,
-                        investment_sensitivity=self.model.params.investment_sensitivity,
-                        autonomous_money_demand=self.model.params.autonomous_money_demand,
-                        income_money_demand=self.model.params.income_money_demand,
-                        interest_money_demand=self.model.params.interest_money_demand,
-                        government_spending=current_G,
-                        taxes=current_T,
-                        money_supply=current_M,
-                        price_level=self.model.params.price_level,
-                    )
-                    current_model = ISLMModel(new_params)
+        p = self.model.params
+        times = np.asarray(shock_times, dtype=np.int64)
+        types = np.asarray(shock_types, dtype=str)
+        sizes = np.asarray(shock_sizes, dtype=np.float64)
 
-            # Calculate equilibrium for this period
-            eq = current_model.calculate_equilibrium()
-            income[t] = eq["income"]
-            interest_rate[t] = eq["interest_rate"]
-            consumption[t] = eq["consumption"]
-            investment[t] = eq["investment"]
+        # Shocks are permanent from their period onward; t=0 is the baseline
+        in_horizon = (times >= 1) & (times < n)
+
+        if not in_horizon.any():
+            # Baseline run: every period sits at the same (cached) equilibrium
+            eq = self.model.calculate_equilibrium()
+            states = {
+                name: np.full(n, eq[name])
+                for name in ("income", "interest_rate", "consumption", "investment")
+            }
+        else:
+            # Build per-period policy paths: base level plus cumulative shocks
+            policy_paths = {}
+            for shock_type, base in (
+                ("G", p.government_spending),
+                ("T", p.taxes),
+                ("M", p.money_supply),
+            ):
+                deltas = np.zeros(n)
+                mask = in_horizon & (types == shock_type)
+                np.add.at(deltas, times[mask], sizes[mask])
+                policy_paths[shock_type] = base + np.cumsum(deltas)
+            G = policy_paths["G"]
+            T = policy_paths["T"]
+            M = policy_paths["M"]
+
+            if (G < 0).any() or (T < 0).any() or (M <= 0).any():
+                raise ValueError(
+                    "Shocks drive government spending, taxes or money supply out of range"
+                )
+
+            # Solve the equilibrium for every period in one batch
+            states = self.model.batch_equilibrium(G, T, M)
+
+        initial_equilibrium = {
+            "income": states["income"][0],
+            "interest_rate": states["interest_rate"][0],
+        }
 
         return SimulationResult(
             time=time,
-            states={
-                "income": income,
-                "interest_rate": interest_rate,
-                "consumption": consumption,
-                "investment": investment,
-            },
+            states={name: path.astype(dtype, copy=False) for name, path in states.items()},
             metadata={
                 "horizon": horizon,
-                "initial_equilibrium": {
-                    "income": income[0],
-                    "interest_rate": interest_rate[0],
-                },
-                "shock_times": shock_times,
-                "shock_types": shock_types,
-                "shock_sizes": shock_sizes,
+                "initial_equilibrium": initial_equilibrium,
+                "shock_times": times.tolist(),
+                "shock_types": types.tolist(),
+                "shock_sizes": sizes.tolist(),
                 "model_params": self.model.params.model_dump(),
             },
         )
 
     def islm_impulse_response(
-        self, shock_type: str, shock_size: float, horizon: int
+        self,
+        shock_type: str,
+        shock_size: float,
+        horizon: int,
+        dtype: DTypeLike = np.float64,
     ) -> SimulationResult:
         """Calculate impulse response to a policy shock in IS-LM model.
 
@@ -290,6 +520,7 @@ class SimulationEngine:
             shock_type: Type of shock ('G', 'T', 'M')
             shock_size: Size of shock
             horizon: Number of periods to simulate
+            dtype: Dtype of the returned state paths
 
         Returns:
             SimulationResult showing response to shock
@@ -300,4 +531,58 @@ class SimulationEngine:
             shock_times=[1],
             shock_types=[shock_type],
             shock_sizes=[shock_size],
+            dtype=dtype,
+        )
+
+    def islm_impulse_response_batch(
+        self, shock_type: str, shock_sizes: Sequence[float], horizon: int
+    ) -> SimulationResult:
+        """Calculate IS-LM impulse responses for many sizes of one policy shock.
+
+        Equivalent to one islm_impulse_response call per size, but the
+        equilibria for all shocks and periods are solved in a single batch.
+
+        Args:
+            shock_type: Type of shock ('G', 'T', 'M')
+            shock_sizes: Sizes of the shocks, shape (B,)
+            horizon: Number of periods to simulate
+
+        Returns:
+            SimulationResult whose states have shape (B, horizon + 1), one
+            row per shock size
+        """
+        p = self.model.params
+        base = {"G": p.government_spending, "T": p.taxes, "M": p.money_supply}
+        if shock_type not in base:
+            raise ValueError(f"Unknown shock type {shock_type!r}; expected 'G', 'T' or 'M'")
+
+        time = np.arange(0, horizon + 1)
+        sizes = np.asarray(shock_sizes, dtype=np.float64)
+
+        # Permanent shock from t=1: (B, 1) sizes times a (n,) step
+        policy = dict(base)
+        policy[shock_type] = base[shock_type] + sizes[:, None] * (time >= 1)
+        G, T, M = policy["G"], policy["T"], policy["M"]
+
+        if (np.asarray(G) < 0).any() or (np.asarray(T) < 0).any() or (np.asarray(M) <= 0).any():
+            raise ValueError(
+                "Shocks drive government spending, taxes or money supply out of range"
+            )
+
+        states = self.model.batch_equilibrium(G, T, M)
+        eq = self.model.calculate_equilibrium()
+
+        return SimulationResult(
+            time=time,
+            states=states,
+            metadata={
+                "horizon": horizon,
+                "initial_equilibrium": {
+                    "income": eq["income"],
+                    "interest_rate": eq["interest_rate"],
+                },
+                "shock_type": shock_type,
+                "shock_sizes": sizes.tolist(),
+                "model_params": self.model.params.model_dump(),
+            },
         )
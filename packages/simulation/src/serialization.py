@@ -0,0 +1,25 @@
+"""
+JSON serialization helpers shared by simulation results and the API.
+
+Kept free of model and engine imports so response layers can use them
+without loading the simulation machinery.
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+def json_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot serialize natively.
+
+    Handles NumPy scalars of dtypes orjson does not cover (e.g. longdouble)
+    and arrays it rejects (non-contiguous views, object dtype).
+    """
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
@@ -1,9 +1,14 @@
 """Tests for simulation engine."""
 
+import dataclasses
+import pickle
+
 import pytest
 import numpy as np
+import orjson
 
 from packages.models.src.macroeconomic.solow import SolowGrowthModel, SolowParameters
+from packages.simulation.src._kernels import solow_jac, solow_rhs
 from packages.simulation.src.engine import SimulationEngine, SimulationResult
 
 
@@ -23,6 +28,31 @@ class TestSimulationResult:
         assert data["states"]["capital"] == [1.0, 1.5, 2.0]
         assert data["metadata"]["horizon"] == 2
 
+    def test_frozen_and_picklable(self):
+        """Results are immutable and survive a round trip to a worker process."""
+        result = SimulationResult(
+            time=np.array([0.0, 1.0]),
+            states={"capital": np.array([1.0, 1.5])},
+            metadata={"horizon": 1},
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.time = np.array([0.0])
+
+        restored = pickle.loads(pickle.dumps(result))
+        assert np.array_equal(restored.states["capital"], result.states["capital"])
+        assert restored.metadata == result.metadata
+
+    def test_to_json_matches_to_dict(self):
+        """JSON bytes decode to the same content as to_dict."""
+        result = SimulationResult(
+            time=np.linspace(0, 1, 5),
+            states={"capital": np.linspace(1.0, 2.0, 5)[::-1]},  # non-contiguous view
+            metadata={"horizon": 1},
+        )
+
+        assert orjson.loads(result.to_json()) == result.to_dict()
+
 
 class TestSimulationEngine:
     """Test simulation engine."""
@@ -55,11 +85,11 @@ class TestSimulationEngine:
 
         # Final capital should be close to steady state
         final_capital = result.states["capital"][-1]
-        assert np.isclose(final_capital, ss["capital"], rtol=0.01)
+        assert np.isclose(final_capital, ss.capital, rtol=0.01)
 
         # Final output should be close to steady state
         final_output = result.states["output"][-1]
-        assert np.isclose(final_output, ss["output"], rtol=0.01)
+        assert np.isclose(final_output, ss.output, rtol=0.01)
 
     def test_simulate_from_above_steady_state(self, engine):
         """Simulation starting above SS should converge down."""
@@ -67,7 +97,7 @@ class TestSimulationEngine:
 
         # Start above steady state
         result = engine.simulate_solow(
-            horizon=100, time_step=1.0, initial_capital=ss["capital"] * 2
+            horizon=100, time_step=1.0, initial_capital=ss.capital * 2
         )
 
         # Capital should decrease
@@ -75,7 +105,7 @@ class TestSimulationEngine:
 
         # Should converge to steady state
         final_capital = result.states["capital"][-1]
-        assert np.isclose(final_capital, ss["capital"], rtol=0.01)
+        assert np.isclose(final_capital, ss.capital, rtol=0.01)
 
     def test_simulate_result_structure(self, engine):
         """Check simulation result has correct structure."""
@@ -84,7 +114,8 @@ class TestSimulationEngine:
         # Check time array
         assert len(result.time) > 0
         assert result.time[0] == 0
-        assert result.time[-1] >= 10
+        assert result.time[-1] == 10
+        assert len(result.time) == 21
 
         # Check state variables
         assert "capital" in result.states
@@ -102,15 +133,72 @@ class TestSimulationEngine:
         assert result.metadata["horizon"] == 10
         assert "steady_state" in result.metadata
 
+    def test_odeint_solver_matches_rk4(self, engine):
+        """Opt-in LSODA path agrees with the default RK4 kernel."""
+        rk4 = engine.simulate_solow(horizon=50, time_step=0.5)
+        lsoda = engine.simulate_solow(horizon=50, time_step=0.5, solver="odeint")
+
+        for name, path in rk4.states.items():
+            assert np.allclose(lsoda.states[name], path, rtol=1e-6)
+
+        with pytest.raises(ValueError, match="solver"):
+            engine.simulate_solow(horizon=10, solver="euler")
+
+    def test_simulate_float32_paths(self, engine):
+        """Reduced-precision output keeps the float64 integration result."""
+        full = engine.simulate_solow(horizon=20)
+        half = engine.simulate_solow(horizon=20, dtype=np.float32)
+
+        for name, path in half.states.items():
+            assert path.dtype == np.float32
+            assert np.allclose(path, full.states[name], rtol=1e-6)
+
+    def test_uneven_time_step_metadata(self, engine):
+        """Metadata reports the step the grid actually uses."""
+        result = engine.simulate_solow(horizon=10, time_step=0.3)
+
+        assert result.time[-1] == 10
+        assert np.allclose(np.diff(result.time), result.metadata["time_step"])
+        assert np.isclose(result.metadata["time_step"], 10 / 33)
+
+        result = engine.simulate_solow(horizon=1, time_step=0.7)
+        assert result.metadata["time_step"] == 1.0
+
+    def test_simulate_rejects_nonpositive_capital(self, engine):
+        """Capital must be positive, with or without Numba installed."""
+        for k0 in (0.0, -1.0):
+            with pytest.raises(ValueError, match="Initial capital"):
+                engine.simulate_solow(horizon=10, initial_capital=k0)
+
     def test_consumption_investment_sum(self, engine):
         """Consumption + investment should equal output."""
         result = engine.simulate_solow(horizon=10)
 
-        for i in range(len(result.time)):
-            c = result.states["consumption"][i]
-            inv = result.states["investment"][i]
-            y = result.states["output"][i]
-            assert np.isclose(c + inv, y, rtol=1e-6)
+        c = result.states["consumption"]
+        inv = result.states["investment"]
+        y = result.states["output"]
+        assert np.allclose(c + inv, y, rtol=1e-6)
+
+    def test_transition_matches_closed_form(self, engine):
+        """RK4 path agrees with the analytical Cobb-Douglas transition.
+
+        With x = k^(1-α) the Solow equation is linear, so
+        x(t) = x* + (x(0) - x*)·exp(-(1-α)(n+g+δ)t).
+        """
+        result = engine.simulate_solow(horizon=50, time_step=0.1, initial_capital=1.0)
+
+        alpha, eff_dep = 0.33, 0.08
+        x_star = 0.2 / eff_dep
+        x = x_star + (1.0 - x_star) * np.exp(-(1 - alpha) * eff_dep * result.time)
+        k_exact = x ** (1 / (1 - alpha))
+
+        assert np.allclose(result.states["capital"], k_exact, rtol=1e-8)
+
+    def test_solow_rhs_matches_model(self, model):
+        """Compiled right-hand side agrees with the model's capital change."""
+        for k in (0.5, 1.0, 4.0, 10.0):
+            dk = solow_rhs(k, 0.0, 0.2, 0.01, 0.02, 0.05, 0.33)
+            assert np.isclose(dk, model.capital_change(k))
 
     def test_impulse_response_higher_savings(self, engine):
         """Positive savings shock should increase steady-state capital."""
@@ -123,20 +211,79 @@ class TestSimulationEngine:
 
         # Should converge to higher capital
         final_capital = result.states["capital"][-1]
-        assert final_capital > ss_initial["capital"]
+        assert final_capital > ss_initial.capital
 
         # Check metadata
         assert result.metadata["shock_var"] == "savings_rate"
         assert result.metadata["shock_size"] == 0.1
 
+    def test_solow_jac_matches_finite_difference(self):
+        """Analytic Jacobian agrees with a central difference of the RHS."""
+        args = (0.0, 0.2, 0.01, 0.02, 0.05, 0.33)
+        h = 1e-6
+        for k in (0.5, 1.0, 4.0, 10.0):
+            fd = (solow_rhs(k + h, *args) - solow_rhs(k - h, *args)) / (2 * h)
+            assert np.isclose(solow_jac(k, *args), fd, rtol=1e-6)
+
+    def test_impulse_response_batch_matches_single(self, engine):
+        """Batched impulse responses match one call per shock size."""
+        sizes = np.array([-0.1, 0.05, 0.1])
+        batch = engine.impulse_response_batch(
+            shock_var="savings_rate", shock_sizes=sizes, horizon=20, time_step=0.5
+        )
+
+        assert batch.states["capital"].shape == (3, len(batch.time))
+        for j, size in enumerate(sizes):
+            single = engine.impulse_response(
+                shock_var="savings_rate", shock_size=size, horizon=20, time_step=0.5
+            )
+            for name, path in single.states.items():
+                assert np.allclose(batch.states[name][j], path)
+            assert np.isclose(
+                batch.metadata["steady_state"]["capital"][j],
+                single.metadata["steady_state"]["capital"],
+            )
+
+    def test_simulate_solow_many_matches_single(self, model):
+        """Parallel runs match one simulate_solow call per parameter set."""
+        runs = [
+            model.params.model_copy(update={"savings_rate": s, "initial_capital": k0})
+            for s, k0 in ((0.15, 1.0), (0.2, 5.0), (0.3, 0.5))
+        ]
+        many = SimulationEngine.simulate_solow_many(runs, horizon=20, time_step=0.5)
+
+        assert many.states["capital"].shape == (3, len(many.time))
+        for j, params in enumerate(runs):
+            single = SimulationEngine(SolowGrowthModel(params)).simulate_solow(
+                horizon=20, time_step=0.5
+            )
+            for name, path in single.states.items():
+                assert np.allclose(many.states[name][j], path)
+
+    def test_impulse_response_invalid_shock(self, engine):
+        """Shocks that push a parameter out of bounds are rejected."""
+        with pytest.raises(ValueError, match="savings_rate"):
+            engine.impulse_response(shock_var="savings_rate", shock_size=0.9, horizon=10)
+        with pytest.raises(ValueError, match="savings_rate"):
+            engine.impulse_response_batch(
+                shock_var="savings_rate", shock_sizes=[0.1, 0.9], horizon=10
+            )
+
+    def test_impulse_response_unknown_shock_var(self, engine):
+        """Shocking a parameter the model does not have is rejected."""
+        with pytest.raises(ValueError, match="Unknown shock variable 'foo'"):
+            engine.impulse_response(shock_var="foo", shock_size=0.1, horizon=10)
+        with pytest.raises(ValueError, match="Unknown shock variable 'foo'"):
+            engine.impulse_response_batch(shock_var="foo", shock_sizes=[0.1], horizon=10)
+
     def test_simulation_at_steady_state(self, engine):
         """Starting at steady state should stay there."""
         ss = engine.model.calculate_steady_state()
 
         result = engine.simulate_solow(
-            horizon=50, time_step=1.0, initial_capital=ss["capital"]
+            horizon=50, time_step=1.0, initial_capital=ss.capital
         )
 
         # Capital should stay constant (within numerical tolerance)
         capital_path = result.states["capital"]
-        assert np.allclose(capital_path, ss["capital"], rtol=0.001)
+        assert np.allclose(capital_path, ss.capital, rtol=0.001)